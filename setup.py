@@ -11,8 +11,8 @@ setup(name = 'siMpLify',
       include_package_data = True,
       version = __version__,
       entry_points = {'console_scripts': ['simplify = simplify.cli:cli']},
-      python_requires = '>= 3.6',
+      python_requires = '>= 3.8',
       install_requires = open('requirements.txt', 'r').read(),
       keywords = 'data science machine learning pandas sklearn',
-      classifiers = ['Programming Language:: Python:: 3.6',
-                     'Programming Language:: Python:: 3.7'])
+      classifiers = ['Programming Language:: Python:: 3.8',
+                     'Programming Language:: Python:: 3.9'])
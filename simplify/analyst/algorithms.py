@@ -8,11 +8,50 @@
 
 from dataclasses import dataclass
 from dataclasses import field
+from itertools import product
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
+import weakref
 
+import joblib
 import numpy as np
 import pandas as pd
+from scipy.stats import norm
+from scipy.stats import rv_discrete
+from sklearn.base import BaseEstimator
+from sklearn.base import clone
+from sklearn.base import TransformerMixin
+from sklearn.model_selection import cross_val_score
+from sklearn.model_selection import train_test_split
+from sklearn.model_selection._search import BaseSearchCV
+from sklearn.preprocessing import MinMaxScaler
+from sklearn.preprocessing import PowerTransformer
+from sklearn.preprocessing import StandardScaler
+from sklearn.utils import check_random_state
+
+
+def __getattr__(name: str) -> Any:
+    """Imports scikit-learn's experimental halving search when it is loaded.
+
+    The 'halving_random' search option loads 'HalvingRandomSearchCV' from
+    this module, so scikit-learn's experimental search is only imported by
+    projects which use it.
+
+    Args:
+        name (str): name of attribute sought.
+
+    Returns:
+        Any: 'HalvingRandomSearchCV' class.
+
+    Raises:
+        AttributeError: if 'name' is not 'HalvingRandomSearchCV'.
+
+    """
+    if name in ['HalvingRandomSearchCV']:
+        from sklearn.experimental import enable_halving_search_cv
+        from sklearn.model_selection import HalvingRandomSearchCV
+        return HalvingRandomSearchCV
+    raise AttributeError(' '.join([name, 'is not in', __name__]))
 
 
 def auto_categorize(
@@ -168,352 +207,840 @@ def smart_fill(
     return data
 
 
+def downcast_features(x: pd.DataFrame) -> pd.DataFrame:
+    """Downcasts numeric columns in 'x' to smaller dtypes.
+
+    Floats become float32 and integers become the smallest integer dtype that
+    holds their values. Columns which are already small are left alone, so
+    repeated calls are cheap.
+
+    Args:
+        x (pd.DataFrame): independent variables/features.
+
+    Returns:
+        pd.DataFrame: 'x' with numeric columns downcast.
+
+    """
+    dtypes = {}
+    for column, dtype in x.dtypes.items():
+        if pd.api.types.is_float_dtype(dtype) and dtype != np.float32:
+            dtypes[column] = np.float32
+        elif (pd.api.types.is_integer_dtype(dtype)
+                and not pd.api.types.is_bool_dtype(dtype)):
+            downcast = pd.to_numeric(x[column], downcast = 'integer').dtype
+            if downcast != dtype:
+                dtypes[column] = downcast
+    if dtypes:
+        x = x.astype(dtypes, copy = False)
+    return x
+
+
+def expected_improvement(
+        mean: np.ndarray,
+        deviation: np.ndarray,
+        best: float,
+        xi: Optional[float] = 0.01) -> np.ndarray:
+    """Computes expected improvement over 'best' for a batch of candidates.
+
+    Args:
+        mean (np.ndarray): predicted scores of the candidates.
+        deviation (np.ndarray): standard deviations of the predicted scores.
+        best (float): highest score observed so far.
+        xi (Optional[float]): margin which favors exploration. Defaults to
+            0.01.
+
+    Returns:
+        np.ndarray: expected improvement of each candidate.
+
+    """
+    deviation = np.maximum(deviation, 1e-9)
+    improvement = mean - best - xi
+    z = improvement / deviation
+    return improvement * norm.cdf(z) + deviation * norm.pdf(z)
+
+
+def sample_parameters(
+        param_distributions: Dict[str, Any],
+        n_iter: int,
+        random_state: np.random.RandomState) -> List[Dict[str, Any]]:
+    """Draws 'n_iter' settings with one bulk draw per parameter.
+
+    Unlike sklearn's 'ParameterSampler', which calls each distribution once for
+    every setting, every distribution here is sampled a single time for all
+    'n_iter' settings.
+
+    Args:
+        param_distributions (Dict[str, Any]): keys are parameter names and
+            values are scipy.stats distributions or lists of choices.
+        n_iter (int): number of settings to draw.
+        random_state (np.random.RandomState): source of random values.
+
+    Returns:
+        List[Dict[str, Any]]: 'n_iter' settings.
+
+    """
+    columns = []
+    for distribution in param_distributions.values():
+        if hasattr(distribution, 'rvs'):
+            columns.append(distribution.rvs(
+                size = n_iter,
+                random_state = random_state).tolist())
+        else:
+            choices = list(distribution)
+            columns.append([
+                choices[index]
+                for index in random_state.randint(len(choices), size = n_iter)])
+    return [
+        dict(zip(param_distributions, values)) for values in zip(*columns)]
+
+
+@dataclass
+class BayesSearch(object):
+    """Searches hyperparameters with a gaussian process.
+
+    After 'n_initial' random settings are scored, each iteration samples
+    'n_candidates' settings, predicts all of their scores with a single call
+    to the gaussian process, and evaluates the candidate with the highest
+    expected improvement. Scoring the whole batch at once replaces optimizing
+    the acquisition function one point at a time.
+
+    Args:
+        estimator (object): sklearn compatible estimator to tune.
+        param_distributions (Dict[str, Any]): keys are parameter names and
+            values are numeric scipy.stats distributions.
+        n_iter (Optional[int]): total number of settings evaluated. Defaults
+            to 20.
+        n_initial (Optional[int]): number of random settings evaluated before
+            the gaussian process is used. Defaults to 5.
+        n_candidates (Optional[int]): number of candidates scored together in
+            each iteration. Defaults to 100.
+        xi (Optional[float]): margin passed to 'expected_improvement'.
+            Defaults to 0.01.
+        scoring (Optional[Union[str, Callable]]): sklearn scorer used to
+            evaluate settings. Defaults to None.
+        cv (Optional[Union[int, object]]): cross-validation splitting
+            strategy. Defaults to 5.
+        refit (Optional[bool]): whether to fit 'best_estimator_' on all of the
+            data passed to 'fit'. Defaults to True.
+        random_state (Optional[int]): seed for sampling. Defaults to None.
+        n_jobs (Optional[int]): number of cross-validation folds fit in
+            parallel. Defaults to None.
+
+    """
+    estimator: object
+    param_distributions: Dict[str, Any]
+    n_iter: Optional[int] = 20
+    n_initial: Optional[int] = 5
+    n_candidates: Optional[int] = 100
+    xi: Optional[float] = 0.01
+    scoring: Optional[Union[str, Callable]] = None
+    cv: Optional[Union[int, object]] = 5
+    refit: Optional[bool] = True
+    random_state: Optional[int] = None
+    n_jobs: Optional[int] = None
+
+    """ Private Methods """
+
+    def _encode(self, settings: List[Dict[str, Any]]) -> np.ndarray:
+        """Converts 'settings' to an array for the gaussian process."""
+        return np.array(
+            [[setting[key] for key in self.param_distributions]
+                for setting in settings],
+            dtype = np.float64)
+
+    def _suggest(self,
+            settings: List[Dict[str, Any]],
+            scores: List[float],
+            random_state: np.random.RandomState) -> Dict[str, Any]:
+        """Returns the candidate setting with the highest expected improvement.
+
+        Args:
+            settings (List[Dict[str, Any]]): settings evaluated so far.
+            scores (List[float]): scores of 'settings'.
+            random_state (np.random.RandomState): source of random candidates.
+
+        Returns:
+            Dict[str, Any]: next setting to evaluate.
+
+        """
+        from sklearn.gaussian_process import GaussianProcessRegressor
+        from sklearn.gaussian_process.kernels import Matern
+        process = GaussianProcessRegressor(
+            kernel = Matern(nu = 2.5),
+            normalize_y = True,
+            random_state = random_state)
+        process.fit(self._encode(settings), scores)
+        candidates = sample_parameters(
+            param_distributions = self.param_distributions,
+            n_iter = self.n_candidates,
+            random_state = random_state)
+        mean, deviation = process.predict(
+            self._encode(candidates),
+            return_std = True)
+        return candidates[int(np.argmax(expected_improvement(
+            mean = mean,
+            deviation = deviation,
+            best = max(scores),
+            xi = self.xi)))]
+
+    def _score(self,
+            parameters: Dict[str, Any],
+            x: Union[pd.DataFrame, np.ndarray],
+            y: Union[pd.Series, np.ndarray]) -> float:
+        """Returns mean cross-validated score of 'parameters'."""
+        estimator = clone(self.estimator).set_params(**parameters)
+        return cross_val_score(
+            estimator, x, y,
+            scoring = self.scoring,
+            cv = self.cv,
+            n_jobs = self.n_jobs).mean()
+
+    """ Scikit-Learn Compatibility Methods """
+
+    def fit(self,
+            x: Union[pd.DataFrame, np.ndarray],
+            y: Optional[Union[pd.Series, np.ndarray]] = None) -> 'BayesSearch':
+        """Searches 'param_distributions' for the best scoring setting.
+
+        Args:
+            x (Union[pd.DataFrame, np.ndarray]): independent
+                variables/features.
+            y (Optional[Union[pd.Series, np.ndarray]]): dependent
+                variable/label.
+
+        """
+        random_state = np.random.RandomState(self.random_state)
+        settings = sample_parameters(
+            param_distributions = self.param_distributions,
+            n_iter = min(self.n_initial, self.n_iter),
+            random_state = random_state)
+        scores = [self._score(setting, x, y) for setting in settings]
+        for _ in range(self.n_iter - len(settings)):
+            setting = self._suggest(
+                settings = settings,
+                scores = scores,
+                random_state = random_state)
+            settings.append(setting)
+            scores.append(self._score(setting, x, y))
+        best = int(np.argmax(scores))
+        self.cv_results_ = {
+            'params': settings,
+            'mean_test_score': np.array(scores)}
+        self.best_params_ = settings[best]
+        self.best_score_ = scores[best]
+        if self.refit:
+            self.best_estimator_ = clone(self.estimator).set_params(
+                **self.best_params_).fit(x, y)
+        return self
+
+
+@dataclass
+class BayesSearchGPU(BayesSearch):
+    """Searches hyperparameters with a gaussian process on a GPU.
+
+    The gaussian process is fit with botorch and a batched
+    'qExpectedImprovement' acquisition function is optimized on 'device' from
+    'n_candidates' raw samples, so the posterior for every sample is computed
+    in one batched tensor operation.
 
-# @dataclass
-# class Gaussify(TechniqueOutline):
-#     """Transforms data columns to more gaussian distribution.
-
-#     The particular method applied is chosen between 'box-cox' and 'yeo-johnson'
-#     based on whether the particular data column has values below zero.
-
-#     Args:
-#         step(str): name of step used.
-#         parameters(dict): dictionary of parameters to pass to selected
-#             algorithm.
-#         name(str): name of class for matching settings in the Idea instance
-#             and for labeling the columns in files exported by Critic.
-#         auto_draft(bool): whether 'finalize' method should be called when
-#             the class is instanced. This should generally be set to True.
-#     """
-
-#     step: str = 'box-cox and yeo-johnson'
-#     parameters: object = None
-#     name: str = 'gaussifier'
-
-#     def __post_init__(self) -> None:
-#         self.idea_sections = ['analyst']
-#         super().__post_init__()
-#         return self
-
-#     def draft(self) -> None:
-#         self.rescaler = self.parameters['rescaler'](
-#                 copy = self.parameters['copy'])
-#         del self.parameters['rescaler']
-#         self._publish_parameters()
-#         self.positive_tool = self.workers['box_cox'](
-#                 method = 'box_cox', **self.parameters)
-#         self.negative_tool = self.workers['yeo_johnson'](
-#                 method = 'yeo_johnson', **self.parameters)
-#         return self
-
-#     def publish(self, dataset, columns = None):
-#         if not columns:
-#             columns = dataset.numerics
-#         for column in columns:
-#             if dataset.x[column].min() >= 0:
-#                 dataset.x[column] = self.positive_tool.fit_transform(
-#                         dataset.x[column])
-#             else:
-#                 dataset.x[column] = self.negative_tool.fit_transform(
-#                         dataset.x[column])
-#             dataset.x[column] = self.rescaler.fit_transform(
-#                     dataset.x[column])
-#         return dataset
-
-# @dataclass
-# class CompareCleaves(TechniqueOutline):
-#     """[summary]
-
-#     Args:
-#         step (str):
-#         parameters (dict):
-#         space (dict):
-#     """
-#     step: str
-#     parameters: object
-#     space: object
-
-#     def __post_init__(self) -> None:
-#         self.idea_sections = ['analyst']
-#         super().__post_init__()
-#         return self
-
-    # def _cleave(self, dataset):
-    #     if self.step != 'all':
-    #         cleave = self.workers[self.step]
-    #         drop_list = [i for i in self.test_columns if i not in cleave]
-    #         for col in drop_list:
-    #             if col in dataset.x_train.columns:
-    #                 dataset.x_train.drop(col, axis = 'columns',
-    #                                          inplace = True)
-    #                 dataset.x_test.drop(col, axis = 'columns',
-    #                                         inplace = True)
-    #     return dataset
-
-    # def _publish_cleaves(self):
-    #     for group, columns in self.workers.items():
-    #         self.test_columns.extend(columns)
-    #     if self.parameters['include_all']:
-    #         self.workers.update({'all': self.test_columns})
-    #     return self
-
-    # def add(self, cleave_group, columns):
-    #     """For the cleavers in siMpLify, this step alows users to manually
-    #     add a new cleave group to the cleaver dictionary.
-    #     """
-    #     self.workers.update({cleave_group: columns})
-    #     return self
-
-
-#        self.scorers = {'f_classif': f_classif,
-#                        'chi2': chi2,
-#                        'mutual_class': mutual_info_classif,
-#                        'mutual_regress': mutual_info_regression}
-
-# @dataclass
-# class CombineCleaves(TechniqueOutline):
-#     """[summary]
-
-#     Args:
-#         step (str):
-#         parameters (dict):
-#         space (dict):
-#     """
-#     step: str
-#     parameters: object
-#     space: object
-
-#     def __post_init__(self) -> None:
-#         super().__post_init__()
-#         return self
-
-
-# @dataclass
-# class SearchComposer(AnalystComposer):
-#     """Searches for optimal model hyperparameters using specified step.
-
-#     Args:
-
-#     Returns:
-#         [type]: [description]
-#     """
-#     name: str = 'search_composer'
-#     algorithm_class: object = SearchAnalystTechnique
-#     step_class: object = SearchTechnique
-
-#     def __post_init__(self) -> None:
-#         self.idea_sections = ['analyst']
-#         super().__post_init__()
-#         return self
-
-#     """ Private Methods """
-
-#     def _build_conditional(self, step: AnalystTechnique, parameters: dict):
-#         """[summary]
-
-#         Args:
-#             step (namedtuple): [description]
-#             parameters (dict): [description]
-#         """
-#         if 'refit' in parameters and isinstance(parameters['scoring'], list):
-#             parameters['scoring'] = parameters['scoring'][0]
-#         return parameters
-#         self.space = {}
-#         if step.hyperparameter_search:
-#             new_parameters = {}
-#             for parameter, values in parameters.items():
-#                 if isinstance(values, list):
-#                     if self._datatype_in_list(values, float):
-#                         self.space.update(
-#                             {parameter: uniform(values[0], values[1])})
-#                     elif self._datatype_in_list(values, int):
-#                         self.space.update(
-#                             {parameter: randint(values[0], values[1])})
-#                 else:
-#                     new_parameters.update({parameter: values})
-#             parameters = new_parameters
-#         return parameters
-
-#     def _search_hyperparameter(self, dataset: Dataset,
-#                                data_to_use: str):
-#         search = SearchComposer()
-#         search.space = self.space
-#         search.estimator = self.algorithm
-#         return search.publish(data = dataset)
-
-#     """ Core siMpLify Methods """
-
-#     def draft(self) -> None:
-#         self.bayes = Technique(
-#             name = 'bayes',
-#             module = 'bayes_opt',
-#             algorithm = 'BayesianOptimization',
-#             runtime = {
-#                 'f': 'estimator',
-#                 'pbounds': 'space',
-#                 'random_state': 'seed'})
-#         self.grid = Technique(
-#             name = 'grid',
-#             module = 'sklearn.model_selection',
-#             algorithm = 'GridSearchCV',
-#             runtime = {
-#                 'estimator': 'estimator',
-#                 'param_distributions': 'space',
-#                 'random_state': 'seed'})
-#         self.random = Technique(
-#             name = 'random',
-#             module = 'sklearn.model_selection',
-#             algorithm = 'RandomizedSearchCV',
-#             runtime = {
-#                 'estimator': 'estimator',
-#                 'param_distributions': 'space',
-#                 'random_state': 'seed'})
-#         super().draft()
-#         return self
-
-
-# @dataclass
-# class SearchAnalystTechnique(AnalystTechnique):
-#     """[summary]
-
-#     Args:
-#         object ([type]): [description]
-#     """
-#     step: str
-#     algorithm: object
-#     parameters: object
-#     data_dependent: object = None
-#     hyperparameter_search: bool = False
-#     space: object = None
-#     name: str = 'search'
-
-#     def __post_init__(self) -> None:
-#         super().__post_init__()
-#         return self
-
-#     @numpy_shield
-#     def publish(self, dataset: Dataset, data_to_use: str):
-#         """[summary]
-
-#         Args:
-#             dataset ([type]): [description]
-#             data_to_use ([type]): [description]
-#         """
-#         if self.step in ['random', 'grid']:
-#             return self.algorithm.fit(
-#                 X = getattr(dataset, ''.join(['x_', data_to_use])),
-#                 Y = getattr(dataset, ''.join(['y_', data_to_use])),
-#                 **kwargs)
-
-
-    # # @numpy_shield
-    # def publish_reduce(self, dataset, plan = None, estimator = None):
-    #     if not estimator:
-    #         estimator = plan.model.algorithm
-    #     self._set_parameters(estimator)
-    #     self.algorithm = self.workers[self.step](**self.parameters)
-    #     if len(dataset.x_train.columns) > self.num_features:
-    #         self.algorithm.fit(dataset.x_train, dataset.y_train)
-    #         mask = ~self.algorithm.get_support()
-    #         dataset.drop_columns(df = dataset.x_train, mask = mask)
-    #         dataset.drop_columns(df = dataset.x_test, mask = mask)
-    #     return dataset
-
-
-    # def _set_reduce_parameters(self, estimator):
-#        if self.step in ['rfe', 'rfecv']:
-#            self.default = {'n_features_to_select': 10,
-#                                       'step': 1}
-#            self.runtime_parameters = {'estimator': estimator}
-#        elif self.step == 'kbest':
-#            self.default = {'k': 10,
-#                                       'score_func': f_classif}
-#            self.runtime_parameters = {}
-#        elif self.step in ['fdr', 'fpr']:
-#            self.default = {'alpha': 0.05,
-#                                       'score_func': f_classif}
-#            self.runtime_parameters = {}
-#        elif self.step == 'custom':
-#            self.default = {'threshold': 'mean'}
-#            self.runtime_parameters = {'estimator': estimator}
-#        self._publish_parameters()
-#        self._select_parameters()
-#        self.parameters.update({'estimator': estimator})
-#        if 'k' in self.parameters:
-#            self.num_features = self.parameters['k']
-#        else:
-#            self.num_features = self.parameters['n_features_to_select']
-        # return self
-
-
-# def make_tensorflow_model(step: 'Technique', parameters: dict) -> None:
-#     algorithm = None
-#     return algorithm
-
-
-#    def _downcast_features(self, dataset):
-#        dataframes = ['x_train', 'x_test']
-#        number_types = ['uint', 'int', 'float']
-#        feature_bits = ['64', '32', '16']
-#        for data in dataframes:
-#            for column in data.columns.keys():
-#                if (column in dataset.floats
-#                        or column in dataset.integers):
-#                    for number_type in number_types:
-#                        for feature_bit in feature_bits:
-#                            try:
-#                                data[column] = data[column].astype()
-
-#
-#    def _set_feature_types(self):
-#        self.type_interface = {'boolean': tensorflow.bool,
-#                               'float': tensorflow.float16,
-#                               'integer': tensorflow.int8,
-#                               'string': object,
-#                               'categorical': CategoricalDtype,
-#                               'list': list,
-#                               'datetime': datetime64,
-#                               'timedelta': timedelta}
-
-
-#    def _tensor_flow_model(self):
-#        from keras.models import Sequential
-#        from keras.layers import Dense, Dropout, Activation, Flatten
-#        classifier = Sequential()
-#        classifier.add(Dense(units = 6, kernel_initializer = 'uniform',
-#            activation = 'relu', input_dim = 30))
-#        classifier.add(Dense(units = 6, kernel_initializer = 'uniform',
-#            activation = 'relu'))
-#        classifier.add(Dense(units = 1, kernel_initializer = 'uniform',
-#            activation = 'sigmoid'))
-#        classifier.compile(optimizer = 'adam',
-#                           loss = 'binary_crossentropy',
-#                           metrics = ['accuracy'])
-#        return classifier
-#        model = Sequential()
-#        model.add(Activation('relu'))
-#        model.add(Activation('relu'))
-#        model.add(Dropout(0.25))
-#        model.add(Flatten())
-#        for layer_size in self.parameters['dense_layer_sizes']:
-#            model.add(Dense(layer_size))
-#            model.add(Activation('relu'))
-#        model.add(Dropout(0.5))
-#        model.add(Dense(2))
-#        model.add(Activation('softmax'))
-#        model.compile(loss = 'categorical_crossentropy',
-#                      optimizer = 'adadelta',
-#                      metrics = ['accuracy'])
-#        return model
-
-
-
-# def make_torch_model(step: 'Technique', parameters: dict) -> None:
-#     algorithm = None
-#     return algorithm
-
-
-# def make_stan_model(step: 'Technique', parameters: dict) -> None:
-#     algorithm = None
-#     return algorithm
+    Args:
+        device (Optional[str]): torch device used for the gaussian process.
+            Defaults to 'cuda'.
 
+    """
+    device: Optional[str] = 'cuda'
+
+    """ Private Methods """
+
+    def _suggest(self,
+            settings: List[Dict[str, Any]],
+            scores: List[float],
+            random_state: np.random.RandomState) -> Dict[str, Any]:
+        """Returns the setting which maximizes 'qExpectedImprovement'.
+
+        Args:
+            settings (List[Dict[str, Any]]): settings evaluated so far.
+            scores (List[float]): scores of 'settings'.
+            random_state (np.random.RandomState): unused, as botorch draws its
+                own raw samples.
+
+        Returns:
+            Dict[str, Any]: next setting to evaluate.
+
+        """
+        import torch
+        from botorch.acquisition import qExpectedImprovement
+        from botorch.fit import fit_gpytorch_mll
+        from botorch.models import SingleTaskGP
+        from botorch.optim import optimize_acqf
+        from gpytorch.mlls import ExactMarginalLogLikelihood
+        tensor_kwargs = {'dtype': torch.float64, 'device': self.device}
+        lower, upper = (
+            torch.tensor(bounds, **tensor_kwargs)
+            for bounds in zip(*[
+                distribution.support()
+                for distribution in self.param_distributions.values()]))
+        span = upper - lower
+        train_x = (torch.tensor(
+            self._encode(settings), **tensor_kwargs) - lower) / span
+        train_y = torch.tensor(scores, **tensor_kwargs).unsqueeze(-1)
+        model = SingleTaskGP(train_x, train_y)
+        fit_gpytorch_mll(ExactMarginalLogLikelihood(model.likelihood, model))
+        candidate, _ = optimize_acqf(
+            qExpectedImprovement(model = model, best_f = train_y.max()),
+            bounds = torch.stack([torch.zeros_like(span), torch.ones_like(span)]),
+            q = 1,
+            num_restarts = 10,
+            raw_samples = self.n_candidates)
+        values = (lower + candidate[0] * span).cpu().numpy()
+        return {
+            key: (int(round(value))
+                if isinstance(distribution.dist, rv_discrete) else value)
+            for (key, distribution), value in zip(
+                self.param_distributions.items(), values)}
+
+
+def _from_quantiles(
+        distribution: Any,
+        quantiles: np.ndarray) -> List[Any]:
+    """Returns the values of 'distribution' at each of 'quantiles'.
+
+    Args:
+        distribution (Any): scipy.stats distribution or list of choices.
+        quantiles (np.ndarray): probabilities between 0 and 1.
+
+    Returns:
+        List[Any]: value of 'distribution' at each quantile.
+
+    """
+    if hasattr(distribution, 'ppf'):
+        values = distribution.ppf(quantiles)
+        if isinstance(distribution.dist, rv_discrete):
+            values = values.astype(np.int64)
+        return values.tolist()
+    else:
+        choices = list(distribution)
+        indices = np.minimum(
+            (quantiles * len(choices)).astype(np.int64), len(choices) - 1)
+        return [choices[index] for index in indices]
+
+
+class GriddedRandomSearchCV(BaseSearchCV):
+    """Randomized search which samples evenly across a grid of strata.
+
+    The range of each parameter is divided into 'branching' equal probability
+    strata and every combination of strata forms a cell of a grid. The 'n_iter'
+    candidates are spread evenly across the cells and drawn at random within
+    them. Compared with independent random draws, this covers the space more
+    uniformly for the same number of fits. When there are more cells than
+    candidates, each parameter is stratified on its own, as in a latin
+    hypercube.
+
+    Args:
+        estimator (object): sklearn compatible estimator to tune.
+        param_distributions (Dict[str, Any]): keys are parameter names and
+            values are scipy.stats distributions or lists of choices.
+        n_iter (Optional[int]): number of candidates evaluated. Defaults to
+            20.
+        branching (Optional[int]): number of strata for each parameter.
+            Defaults to 3.
+        random_state (Optional[int]): seed for sampling. Defaults to None.
+        kwargs: any other parameters of sklearn's 'BaseSearchCV', such as
+            'scoring', 'cv', 'refit', and 'n_jobs'.
+
+    """
+    def __init__(self,
+            estimator: object,
+            param_distributions: Dict[str, Any],
+            *,
+            n_iter: Optional[int] = 20,
+            branching: Optional[int] = 3,
+            scoring: Optional[Union[str, Callable]] = None,
+            n_jobs: Optional[int] = None,
+            refit: Optional[bool] = True,
+            cv: Optional[Union[int, object]] = None,
+            verbose: Optional[int] = 0,
+            pre_dispatch: Optional[str] = '2*n_jobs',
+            random_state: Optional[int] = None,
+            error_score: Optional[float] = np.nan,
+            return_train_score: Optional[bool] = False) -> None:
+        self.param_distributions = param_distributions
+        self.n_iter = n_iter
+        self.branching = branching
+        self.random_state = random_state
+        super().__init__(
+            estimator = estimator,
+            scoring = scoring,
+            n_jobs = n_jobs,
+            refit = refit,
+            cv = cv,
+            verbose = verbose,
+            pre_dispatch = pre_dispatch,
+            error_score = error_score,
+            return_train_score = return_train_score)
+
+    """ Private Methods """
+
+    def _cells(self,
+            random_state: np.random.RandomState) -> np.ndarray:
+        """Returns the stratum of every parameter for each candidate."""
+        dimensions = len(self.param_distributions)
+        if self.branching ** dimensions <= self.n_iter:
+            grid = np.array(
+                list(product(range(self.branching), repeat = dimensions)),
+                dtype = np.int64).reshape(-1, dimensions)
+            counts = np.full(len(grid), self.n_iter // len(grid))
+            counts[random_state.choice(
+                len(grid), self.n_iter % len(grid), replace = False)] += 1
+            return np.repeat(grid, counts, axis = 0)
+        else:
+            strata = np.arange(self.n_iter) % self.branching
+            return np.column_stack([
+                random_state.permutation(strata) for _ in range(dimensions)])
+
+    def _draw(self,
+            distribution: Any,
+            cells: np.ndarray,
+            random_state: np.random.RandomState) -> List[Any]:
+        """Returns a random value of 'distribution' from each of 'cells'."""
+        quantiles = (cells + random_state.uniform(size = len(cells))) / (
+            self.branching)
+        return _from_quantiles(
+            distribution = distribution,
+            quantiles = quantiles)
+
+    def _sample(self) -> List[Dict[str, Any]]:
+        """Returns 'n_iter' candidate settings spread across the grid."""
+        random_state = check_random_state(self.random_state)
+        cells = self._cells(random_state = random_state)
+        columns = [
+            self._draw(distribution, cells[:, index], random_state)
+            for index, distribution in enumerate(
+                self.param_distributions.values())]
+        return [
+            dict(zip(self.param_distributions, values))
+            for values in zip(*columns)]
+
+    def _run_search(self, evaluate_candidates: Callable) -> None:
+        """Evaluates the gridded random candidates."""
+        evaluate_candidates(self._sample())
+        return
+
+
+class SobolSearchCV(BaseSearchCV):
+    """Randomized search which draws candidates from a Sobol sequence.
+
+    Candidates are the points of a scrambled Sobol sequence mapped through the
+    inverse cumulative distribution of each parameter. The low discrepancy of
+    the sequence covers the space more evenly than independent random draws,
+    so good regions are usually found with fewer fits. Independent uniform
+    draws are used instead when there are more than 'max_dimensions'
+    parameters, where Sobol sequences need far more points to stay balanced.
+
+    Args:
+        estimator (object): sklearn compatible estimator to tune.
+        param_distributions (Dict[str, Any]): keys are parameter names and
+            values are scipy.stats distributions or lists of choices.
+        n_iter (Optional[int]): number of candidates evaluated. Defaults to
+            20.
+        max_dimensions (Optional[int]): largest number of parameters drawn
+            from a Sobol sequence. Defaults to 20.
+        random_state (Optional[int]): seed for scrambling. Defaults to None.
+        kwargs: any other parameters of sklearn's 'BaseSearchCV', such as
+            'scoring', 'cv', 'refit', and 'n_jobs'.
+
+    """
+    def __init__(self,
+            estimator: object,
+            param_distributions: Dict[str, Any],
+            *,
+            n_iter: Optional[int] = 20,
+            max_dimensions: Optional[int] = 20,
+            scoring: Optional[Union[str, Callable]] = None,
+            n_jobs: Optional[int] = None,
+            refit: Optional[bool] = True,
+            cv: Optional[Union[int, object]] = None,
+            verbose: Optional[int] = 0,
+            pre_dispatch: Optional[str] = '2*n_jobs',
+            random_state: Optional[int] = None,
+            error_score: Optional[float] = np.nan,
+            return_train_score: Optional[bool] = False) -> None:
+        self.param_distributions = param_distributions
+        self.n_iter = n_iter
+        self.max_dimensions = max_dimensions
+        self.random_state = random_state
+        super().__init__(
+            estimator = estimator,
+            scoring = scoring,
+            n_jobs = n_jobs,
+            refit = refit,
+            cv = cv,
+            verbose = verbose,
+            pre_dispatch = pre_dispatch,
+            error_score = error_score,
+            return_train_score = return_train_score)
+
+    """ Private Methods """
+
+    def _quantiles(self) -> np.ndarray:
+        """Returns 'n_iter' points in the unit cube, a column per parameter."""
+        dimensions = len(self.param_distributions)
+        if dimensions > self.max_dimensions:
+            return check_random_state(self.random_state).uniform(
+                size = (self.n_iter, dimensions))
+        else:
+            from scipy.stats import qmc
+            # Draws a balanced power of two points and keeps the first
+            # 'n_iter'.
+            sampler = qmc.Sobol(
+                d = dimensions,
+                scramble = True,
+                seed = self.random_state)
+            return sampler.random_base2(
+                m = int(np.ceil(np.log2(max(self.n_iter, 1)))))[:self.n_iter]
+
+    def _sample(self) -> List[Dict[str, Any]]:
+        """Returns 'n_iter' candidate settings from the Sobol sequence."""
+        quantiles = self._quantiles()
+        columns = [
+            _from_quantiles(
+                distribution = distribution,
+                quantiles = quantiles[:, index])
+            for index, distribution in enumerate(
+                self.param_distributions.values())]
+        return [
+            dict(zip(self.param_distributions, values))
+            for values in zip(*columns)]
+
+    def _run_search(self, evaluate_candidates: Callable) -> None:
+        """Evaluates the Sobol candidates."""
+        evaluate_candidates(self._sample())
+        return
+
+
+@dataclass
+class ColumnChunks(BaseEstimator, TransformerMixin):
+    """Fits copies of a column-wise transformer to chunks of columns in parallel.
+
+    Scalers such as 'RobustScaler', 'QuantileTransformer', and 'Gaussify'
+    treat every column independently but run on a single core. The columns
+    are split into one contiguous chunk per job, and a clone of 'estimator' is
+    fit to each chunk by a separate joblib worker.
+
+    Args:
+        estimator (object): transformer which treats columns independently.
+        n_jobs (Optional[int]): number of chunks fit in parallel. Defaults to
+            -1, which uses every core.
+
+    """
+    estimator: object
+    n_jobs: Optional[int] = -1
+
+    """ Scikit-Learn Compatibility Methods """
+
+    def fit(self,
+            x: Union[pd.DataFrame, np.ndarray],
+            y: Optional[Union[pd.Series, np.ndarray]] = None) -> 'ColumnChunks':
+        """Fits a clone of 'estimator' to each chunk of columns in 'x'.
+
+        Args:
+            x (Union[pd.DataFrame, np.ndarray]): independent
+                variables/features.
+            y (Optional[Union[pd.Series, np.ndarray]]): dependent
+                variable/label. Ignored.
+
+        """
+        x = np.asarray(x)
+        self.chunks_ = np.array_split(
+            np.arange(x.shape[1]),
+            min(joblib.effective_n_jobs(self.n_jobs), x.shape[1]))
+        self.estimators_ = joblib.Parallel(n_jobs = self.n_jobs)(
+            joblib.delayed(clone(self.estimator).fit)(x[:, chunk])
+            for chunk in self.chunks_)
+        return self
+
+    def transform(self, x: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """Transforms each chunk of columns with its fitted estimator.
+
+        Args:
+            x (Union[pd.DataFrame, np.ndarray]): independent
+                variables/features.
+
+        Returns:
+            np.ndarray: transformed 'x' with columns in their original order.
+
+        """
+        x = np.asarray(x)
+        return np.hstack([
+            estimator.transform(x[:, chunk])
+            for estimator, chunk in zip(self.estimators_, self.chunks_)])
+
+
+@dataclass
+class Gaussify(BaseEstimator, TransformerMixin):
+    """Transforms columns to more gaussian distributions.
+
+    Columns with only positive values are transformed with 'box-cox' and all
+    other columns with 'yeo-johnson'. Each group of columns is fit with one
+    call to a 'PowerTransformer' instead of one call per column, and the
+    result is then rescaled with 'rescaler'. The transformers are fit on at
+    most 'subsample' random rows, since their estimates converge long before
+    every row of a large dataset is used.
+
+    Args:
+        standardize (Optional[bool]): whether the power transformers scale
+            their output to zero mean and unit variance. Defaults to False.
+        copy (Optional[bool]): whether the rescaler copies its input. Defaults
+            to False.
+        rescaler (Optional[str]): name of the scaler applied after the power
+            transformations, either 'standard' or 'minmax'. Defaults to
+            'standard'.
+        subsample (Optional[int]): maximum number of rows used for fitting.
+            Defaults to 100000.
+        random_state (Optional[int]): seed for choosing the rows used for
+            fitting. Defaults to None.
+
+    """
+    standardize: Optional[bool] = False
+    copy: Optional[bool] = False
+    rescaler: Optional[str] = 'standard'
+    subsample: Optional[int] = 100000
+    random_state: Optional[int] = None
+
+    rescalers: ClassVar[Dict[str, object]] = {
+        'minmax': MinMaxScaler,
+        'standard': StandardScaler}
+
+    """ Private Methods """
+
+    def _power_transform(self, x: np.ndarray) -> np.ndarray:
+        """Applies the fitted power transformers to their columns of 'x'."""
+        transformed = np.empty_like(x)
+        for indices, transformer in (
+                (self.box_cox_columns_, 'box_cox_'),
+                (self.yeo_johnson_columns_, 'yeo_johnson_')):
+            if indices.size:
+                # The gathered block is already a copy, so it is transformed
+                # in place.
+                transformed[:, indices] = getattr(self, transformer).transform(
+                    x[:, indices])
+        return transformed
+
+    """ Scikit-Learn Compatibility Methods """
+
+    def fit(self,
+            x: Union[pd.DataFrame, np.ndarray],
+            y: Optional[Union[pd.Series, np.ndarray]] = None) -> 'Gaussify':
+        """Fits the power transformers and rescaler to 'x'.
+
+        Args:
+            x (Union[pd.DataFrame, np.ndarray]): independent
+                variables/features.
+            y (Optional[Union[pd.Series, np.ndarray]]): dependent
+                variable/label. Ignored.
+
+        """
+        x = np.asarray(x, dtype = np.float64)
+        # Column minimums use every row, so 'box-cox' never sees a value at or
+        # below zero that the subsample missed.
+        self.positive_ = x.min(axis = 0) > 0
+        self.box_cox_columns_ = np.flatnonzero(self.positive_)
+        self.yeo_johnson_columns_ = np.flatnonzero(~self.positive_)
+        if self.subsample is not None and x.shape[0] > self.subsample:
+            x = x[np.sort(check_random_state(self.random_state).choice(
+                x.shape[0], size = self.subsample, replace = False))]
+        if self.box_cox_columns_.size:
+            self.box_cox_ = PowerTransformer(
+                method = 'box-cox',
+                standardize = self.standardize,
+                copy = False).fit(x[:, self.box_cox_columns_])
+        if self.yeo_johnson_columns_.size:
+            self.yeo_johnson_ = PowerTransformer(
+                method = 'yeo-johnson',
+                standardize = self.standardize,
+                copy = False).fit(x[:, self.yeo_johnson_columns_])
+        self.rescaler_ = self.rescalers[self.rescaler](copy = self.copy).fit(
+            self._power_transform(x))
+        return self
+
+    def transform(self, x: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """Transforms 'x' with the fitted power transformers and rescaler.
+
+        Args:
+            x (Union[pd.DataFrame, np.ndarray]): independent
+                variables/features.
+
+        Returns:
+            np.ndarray: transformed 'x'.
+
+        """
+        x = np.asarray(x, dtype = np.float64)
+        return self.rescaler_.transform(self._power_transform(x))
+
+
+@dataclass
+class TrainTestSplit(object):
+    """Splits rows once into training and testing sets.
+
+    Classification labels are stratified through 'train_test_split' when
+    'stratify' is True. Otherwise, the testing rows are drawn directly with
+    'np.random.Generator.choice' instead of shuffling every row index as
+    'ShuffleSplit' does.
+
+    Args:
+        test_size (Optional[float]): fraction of rows in the testing set.
+            Defaults to 0.33.
+        random_state (Optional[int]): seed for the split. Defaults to None.
+        stratify (Optional[bool]): whether to stratify the split by label.
+            Defaults to False.
+
+    """
+    test_size: Optional[float] = 0.33
+    random_state: Optional[int] = None
+    stratify: Optional[bool] = False
+
+    """ Scikit-Learn Compatibility Methods """
+
+    def get_n_splits(self, *args, **kwargs) -> int:
+        """Returns the number of splits, which is always 1."""
+        return 1
+
+    def split(self,
+            x: Union[pd.DataFrame, np.ndarray],
+            y: Optional[Union[pd.Series, np.ndarray]] = None,
+            groups: Optional[np.ndarray] = None) -> Iterable[
+                Tuple[np.ndarray, np.ndarray]]:
+        """Yields a single pair of training and testing row indices.
+
+        Args:
+            x (Union[pd.DataFrame, np.ndarray]): independent
+                variables/features.
+            y (Optional[Union[pd.Series, np.ndarray]]): dependent
+                variable/label. Used to stratify the split if 'stratify' is
+                True.
+            groups (Optional[np.ndarray]): ignored.
+
+        Yields:
+            Tuple[np.ndarray, np.ndarray]: training and testing row indices.
+
+        """
+        rows = len(x)
+        if self.stratify and y is not None:
+            yield tuple(train_test_split(
+                np.arange(rows),
+                test_size = self.test_size,
+                random_state = self.random_state,
+                stratify = y))
+        else:
+            test_index = np.random.default_rng(self.random_state).choice(
+                rows,
+                size = int(np.ceil(self.test_size * rows)),
+                replace = False)
+            train_mask = np.ones(rows, dtype = bool)
+            train_mask[test_index] = False
+            yield np.flatnonzero(train_mask), np.sort(test_index)
+
+
+@dataclass
+class CachedScorer(object):
+    """Memoizes a feature selection 'score_func' by the data it scores.
+
+    Chapters which share the same data and folds before their 'reduce' step
+    refit the same selector on the same arrays, so only the first fit
+    computes the scores. Scores are stored under 'digest' if it is set (the
+    Analyst sets it to the digest of the data passed to the step). Otherwise,
+    they are stored under the address, shape, strides, and dtype of 'x' and
+    'y', which are only reused while the arrays owning that memory are alive.
+    At most 'cache_size' results are kept, and the oldest are dropped first.
+
+    Args:
+        score_func (Callable): function which takes 'x' and 'y' and returns
+            scores or a tuple of scores and p-values.
+        scores (Optional[Dict[Tuple[Any, ...], Any]]): stored scores, which
+            may be shared by every scorer created in a single run. Defaults to
+            an empty dictionary.
+        cache_size (Optional[int]): maximum number of stored scores. Defaults
+            to 64.
+        digest (Optional[str]): digest of the data about to be scored.
+            Defaults to None.
+
+    """
+    score_func: Callable
+    scores: Optional[Dict[Tuple[Any, ...], Any]] = field(
+        default_factory = dict)
+    cache_size: Optional[int] = 64
+    digest: Optional[str] = None
+
+    def __call__(self,
+            x: Union[pd.DataFrame, np.ndarray],
+            y: Union[pd.Series, np.ndarray]) -> Union[
+                np.ndarray, Tuple[np.ndarray, np.ndarray]]:
+        """Returns stored scores for 'x' and 'y' or computes them.
+
+        Args:
+            x (Union[pd.DataFrame, np.ndarray]): independent
+                variables/features.
+            y (Union[pd.Series, np.ndarray]): dependent variable/label.
+
+        Returns:
+            Union[np.ndarray, Tuple[np.ndarray, np.ndarray]]: output of
+                'score_func'.
+
+        """
+        if self.digest is not None:
+            key = (self.score_func, self.digest)
+            owners = ()
+        else:
+            (x_key, x_owner), (y_key, y_owner) = (
+                self._identify(array = x), self._identify(array = y))
+            key = (self.score_func, x_key, y_key)
+            owners = (weakref.ref(x_owner), weakref.ref(y_owner))
+        try:
+            stored_owners, scores = self.scores[key]
+            if all(owner() is not None for owner in stored_owners):
+                return scores
+        except KeyError:
+            if len(self.scores) >= self.cache_size:
+                del self.scores[next(iter(self.scores))]
+        scores = self.score_func(x, y)
+        self.scores[key] = (owners, scores)
+        return scores
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns state for pickling without the stored scores or digest.
+
+        Hashes of the pickled state (e.g. in '_chain_digest') then depend only
+        on 'score_func' and 'cache_size', not on the last data scored.
+
+        Returns:
+            Dict[str, Any]: instance attributes with an empty 'scores' and no
+                'digest'.
+
+        """
+        state = self.__dict__.copy()
+        state['scores'] = {}
+        state['digest'] = None
+        return state
+
+    def _identify(self,
+            array: Union[pd.DataFrame, pd.Series, np.ndarray]) -> Tuple[
+                Tuple[Any, ...], np.ndarray]:
+        """Returns a key for the memory read by 'array' and its owner.
+
+        Args:
+            array (Union[pd.DataFrame, pd.Series, np.ndarray]): data to
+                identify without reading its values.
+
+        Returns:
+            Tuple[Tuple[Any, ...], np.ndarray]: address, shape, strides, and
+                dtype of 'array' and the array which owns its memory.
+
+        """
+        array = np.asarray(array)
+        owner = array
+        while isinstance(owner.base, np.ndarray):
+            owner = owner.base
+        return (
+            (array.__array_interface__['data'][0], array.shape,
+                array.strides, array.dtype.str),
+            owner)
@@ -9,14 +9,24 @@
 from copy import deepcopy
 from dataclasses import dataclass
 from dataclasses import field
+from functools import partial
 from functools import wraps
+from importlib import import_module
+from importlib.util import find_spec
 from inspect import signature
+from types import MappingProxyType
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
 
+import joblib
+from joblib import Memory
 import numpy as np
 import pandas as pd
-from scipy.stats import randint, uniform
+from scipy import sparse
+from sklearn.base import clone
+from sklearn.model_selection import GridSearchCV
+from sklearn.model_selection import ShuffleSplit
+from sklearn.model_selection import StratifiedShuffleSplit
 from sklearn.utils import check_X_y
 from sklearn.utils.validation import check_is_fitted
 
@@ -57,12 +67,136 @@ class Cookbook(Book):
 
 """ Technique Subclass and Decorator """
 
+def _fit_algorithm(algorithm: object,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.Series, np.ndarray]) -> object:
+    """Fits 'algorithm' to 'x' and 'y'.
+
+    This is a module-level function so that 'joblib.Memory' can hash its
+    arguments and return an already fitted 'algorithm' on repeat calls.
+
+    Args:
+        algorithm (object): an estimator with a 'fit' method.
+        x (Union[pd.DataFrame, np.ndarray]): independent variables/features.
+        y (Union[pd.Series, np.ndarray]): dependent variable/label.
+
+    Returns:
+        object: fitted 'algorithm'.
+
+    """
+    return algorithm.fit(x, y)
+
+
+def _fit_transform(technique: 'AnalystTechnique',
+        digest: str,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.Series, np.ndarray],
+        x_test: Optional[Union[pd.DataFrame, np.ndarray]] = None,
+        y_test: Optional[Union[pd.Series, np.ndarray]] = None) -> Tuple[
+            Any, ...]:
+    """Fits 'technique' to 'x' and 'y' and transforms 'x' and 'x_test'.
+
+    'joblib.Memory' caches this function with only 'digest' hashed, so the
+    data is never hashed again after the chain of digests is started.
+
+    Args:
+        technique ('AnalystTechnique'): technique to fit and apply.
+        digest (str): hash of the data before this step and of every
+            earlier step, including 'technique'.
+        x (Union[pd.DataFrame, np.ndarray]): independent variables/features
+            to fit and transform.
+        y (Union[pd.Series, np.ndarray]): dependent variable/label.
+        x_test (Optional[Union[pd.DataFrame, np.ndarray]]): testing features
+            to transform. Defaults to None.
+        y_test (Optional[Union[pd.Series, np.ndarray]]): testing label.
+            Defaults to None.
+
+    Returns:
+        Tuple[Any, ...]: fitted algorithm, transformed 'x', and, if passed,
+            transformed 'x_test'.
+
+    """
+    technique.fit(x = x, y = y)
+    results = (technique.algorithm, technique.transform(x = x, y = y))
+    if x_test is not None:
+        results += (technique.transform(x = x_test, y = y_test),)
+    return results
+
+
+def _resample_features(technique: 'AnalystTechnique',
+        digest: str,
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.Series, np.ndarray]) -> Tuple[Any, Any]:
+    """Resamples 'x' and 'y' with 'technique'.
+
+    'joblib.Memory' caches this function with only 'digest' hashed, like
+    '_fit_transform'.
+
+    Args:
+        technique ('AnalystTechnique'): sampler to apply.
+        digest (str): hash of the data before this step and of every
+            earlier step, including 'technique'.
+        x (Union[pd.DataFrame, np.ndarray]): independent variables/features.
+        y (Union[pd.Series, np.ndarray]): dependent variable/label.
+
+    Returns:
+        Tuple[Any, Any]: resampled 'x' and 'y'.
+
+    """
+    return technique._fit_resample(x = x, y = y)
+
+
+def _search_estimator(searcher: Callable,
+        digest: Optional[str],
+        settings: Tuple[Any, ...],
+        x: Union[pd.DataFrame, np.ndarray],
+        y: Union[pd.Series, np.ndarray]) -> Tuple[object, Dict[str, Any]]:
+    """Searches with 'searcher' and returns the best estimator and settings.
+
+    'joblib.Memory' caches this function with only 'digest' and 'settings'
+    hashed, so chapters which pass identical data to an identical search
+    reuse its result instead of fitting every candidate again.
+
+    Args:
+        searcher (Callable): fits a search to 'x' and 'y' and returns it.
+        digest (Optional[str]): hash of the data and of every earlier step.
+        settings (Tuple[Any, ...]): search technique name and parameters.
+        x (Union[pd.DataFrame, np.ndarray]): independent variables/features.
+        y (Union[pd.Series, np.ndarray]): dependent variable/label.
+
+    Returns:
+        Tuple[object, Dict[str, Any]]: best estimator and its parameters.
+
+    """
+    algorithm = searcher(x = x, y = y)
+    return algorithm.best_estimator_, algorithm.best_params_
+
+
+def _pairwise_matrix(x: np.ndarray, kind: str) -> np.ndarray:
+    """Computes the pairwise matrix passed to 'precomputed' algorithms.
+
+    Args:
+        x (np.ndarray): independent variables/features.
+        kind (str): either 'distances' for euclidean distances or
+            'similarities' for negative squared euclidean distances.
+
+    Returns:
+        np.ndarray: n x n matrix for the rows of 'x'.
+
+    """
+    from sklearn.metrics import pairwise_distances
+    matrix = pairwise_distances(x, n_jobs = -1)
+    if kind in ['similarities']:
+        matrix = -np.square(matrix, out = matrix)
+    return matrix
+
+
 def numpy_shield(callable: Callable) -> Callable:
     """
     """
+    call_signature = signature(callable)
     @wraps(callable)
     def wrapper(*args, **kwargs):
-        call_signature = signature(callable)
         arguments = dict(call_signature.bind(*args, **kwargs).arguments)
         try:
             x_columns = list(arguments['x'].columns.values)
@@ -98,17 +232,55 @@ class AnalystTechnique(Technique):
     fit_method: Optional[str] = field(default_factory = lambda: 'fit')
     transform_method: Optional[str] = field(
         default_factory = lambda: 'transform')
+    dtype: Optional[str] = None
+    precompute: Optional[str] = None
+    column_jobs: Optional[int] = None
+    sparse: Optional[bool] = False
+    support_indices: Optional[np.ndarray] = field(
+        default = None,
+        init = False,
+        repr = False)
+    # Per-run settings copied from the 'Analyst' when chapters are finalized,
+    # so they travel with each technique to worker processes.
+    memory: Optional['Memory'] = field(default = None, repr = False)
+    memoized_steps: Optional[Tuple[str, ...]] = ('scale', 'encode', 'sample')
+    balance_tolerance: Optional[float] = None
+    verbose: Optional[bool] = False
+    cached_steps: ClassVar[Tuple[str, ...]] = ('scale', 'reduce', 'model')
+    min_chunked_columns: ClassVar[int] = 32
+    max_sparse_density: ClassVar[float] = 0.1
 
     """ Core siMpLify Methods """
 
     def apply(self, data: 'Dataset') -> 'Dataset':
-        if data.stages.current in ['full']:
-            self.fit(x = data.x, y = data.y)
-            data.x = self.transform(x = data.x, y = data.y)
+        digest = self._chain_digest(data = data)
+        # Lets a memoized 'score_func' store scores under the data digest.
+        score_func = self.parameters.get('score_func')
+        if isinstance(score_func, algorithms.CachedScorer):
+            score_func.digest = data.digest
+        # Skips fitting a selector which would keep every column.
+        if self.step in ['reduce'] and self._keeps_all_columns(data = data):
+            return data
+        # Resamples once, and only the data used for fitting.
+        elif self.step in ['sample']:
+            data = self._resample(data = data, digest = digest)
+        # Reuses the output of an identical chain of earlier steps.
+        elif digest is not None and self.step in self.memoized_steps:
+            data = self._apply_memoized(data = data, digest = digest)
         else:
-            self.fit(x = data.x_train, y = data.y_train)
-            data.x_train = self.transform(x = data.x_train, y = data.y_train)
-            data.x_test = self.transform(x = data.x_test, y = data.y_test)
+            # Halves memory bandwidth for feature selectors and models.
+            if self.step in ['reduce', 'model']:
+                self._downcast(data = data)
+            if data.stages.current in ['full']:
+                self.fit(x = data.x, y = data.y)
+                data.x = self.transform(x = data.x, y = data.y)
+            else:
+                self.fit(x = data.x_train, y = data.y_train)
+                data.x_train = self.transform(
+                    x = data.x_train,
+                    y = data.y_train)
+                data.x_test = self.transform(x = data.x_test, y = data.y_test)
+        data.digest = digest
         return data
 
     """ Scikit-Learn Compatibility Methods """
@@ -129,12 +301,35 @@ class AnalystTechnique(Technique):
             AttributeError if no 'fit' method exists for 'technique'.
 
         """
+        self.support_indices = None
         x, y = check_X_y(X = x, y = y, accept_sparse = True)
+        if self.dtype is not None:
+            x = x.astype(self.dtype, copy = False)
+        if self.precompute is not None:
+            # The cached matrix is reused by chapters which produce the same
+            # features before this step.
+            if self.memory is not None:
+                x = self.memory.cache(_pairwise_matrix)(x, self.precompute)
+            else:
+                x = _pairwise_matrix(x, self.precompute)
+        # Splits single-threaded column-wise scalers across cores.
+        if (self.column_jobs is not None
+                and x.shape[1] >= self.min_chunked_columns
+                and not isinstance(self.algorithm, algorithms.ColumnChunks)):
+            self.algorithm = algorithms.ColumnChunks(
+                estimator = self.algorithm,
+                n_jobs = self.column_jobs)
         if self.fit_method is not None:
             if y is None:
                 getattr(self.algorithm, self.fit_method)(x)
+            elif self.step in self.cached_steps and self.memory is not None:
+                self.algorithm = self.memory.cache(_fit_algorithm)(
+                    self.algorithm, x, y)
             else:
                 self.algorithm = self.algorithm.fit(x, y)
+        # Stores the selected columns once instead of on every transform.
+        if self.step in ['reduce'] and hasattr(self.algorithm, 'get_support'):
+            self.support_indices = self.algorithm.get_support(indices = True)
         return self
 
     @numpy_shield
@@ -158,7 +353,11 @@ class AnalystTechnique(Technique):
                 'process'.
 
         """
-        if self.transform_method is not None:
+        if self.step in ['reduce'] and hasattr(self.algorithm, 'get_support'):
+            return self._select_columns(x = x)
+        elif self.step in ['scale'] and isinstance(x, pd.DataFrame):
+            return self._scale_array(x = x)
+        elif self.transform_method is not None:
             try:
                 return getattr(self.algorithm, self.transform_method)(x)
             except AttributeError:
@@ -166,6 +365,367 @@ class AnalystTechnique(Technique):
         else:
             return x
 
+    """ Private Methods """
+
+    def _chain_digest(self, data: 'Dataset') -> Optional[str]:
+        """Returns the digest of 'data' after this technique is applied.
+
+        The digest of 'data' covers the original data and every technique
+        already applied to it, so hashing it with the parameters of this
+        technique identifies the output without hashing the data again.
+
+        Args:
+            data ('Dataset'): instance with a 'digest' set by the 'Analyst'.
+
+        Returns:
+            Optional[str]: new digest or None if 'data' has no digest or
+                there is no shared 'memory'.
+
+        """
+        if self.memory is None or data.digest is None:
+            return None
+        else:
+            try:
+                parameters = self.algorithm.get_params()
+            except AttributeError:
+                parameters = self.parameters
+            return joblib.hash((data.digest, self.name, parameters))
+
+    def _apply_memoized(self, data: 'Dataset', digest: str) -> 'Dataset':
+        """Fits and transforms 'data' through the shared 'memory'.
+
+        Args:
+            data ('Dataset'): instance with features to transform.
+            digest (str): digest of the output from '_chain_digest'.
+
+        Returns:
+            'Dataset': with transformed features.
+
+        """
+        self.support_indices = None
+        fit_transform = self.memory.cache(
+            _fit_transform,
+            ignore = ['technique', 'x', 'y', 'x_test', 'y_test'])
+        if data.stages.current in ['full']:
+            self.algorithm, data.x = fit_transform(
+                technique = self,
+                digest = digest,
+                x = data.x,
+                y = data.y)
+        else:
+            self.algorithm, data.x_train, data.x_test = fit_transform(
+                technique = self,
+                digest = digest,
+                x = data.x_train,
+                y = data.y_train,
+                x_test = data.x_test,
+                y_test = data.y_test)
+        return data
+
+    def _downcast(self, data: 'Dataset') -> None:
+        """Downcasts the features of 'data' used by the current stage.
+
+        Args:
+            data ('Dataset'): instance with features to downcast.
+
+        """
+        if data.stages.current in ['full']:
+            data.x = algorithms.downcast_features(x = data.x)
+        else:
+            data.x_train = algorithms.downcast_features(x = data.x_train)
+            data.x_test = algorithms.downcast_features(x = data.x_test)
+
+    def _keeps_all_columns(self, data: 'Dataset') -> bool:
+        """Returns whether a selector would keep every column of 'data'.
+
+        Args:
+            data ('Dataset'): instance with features to reduce.
+
+        Returns:
+            bool: True if the number of features to keep is 'all' or at least
+                the number of columns in the features used by the current
+                stage.
+
+        """
+        limit = next(
+            (self.parameters[key] for key in
+                ['k', 'n_features_to_select', 'min_features_to_select']
+                if key in self.parameters),
+            None)
+        if limit in ['all']:
+            return True
+        elif isinstance(limit, int) and not isinstance(limit, bool):
+            if data.stages.current in ['full']:
+                return data.x.shape[1] <= limit
+            else:
+                return data.x_train.shape[1] <= limit
+        else:
+            return False
+
+    def _resample(self,
+            data: 'Dataset',
+            digest: Optional[str] = None) -> 'Dataset':
+        """Resamples the features and label used for fitting in 'data'.
+
+        A single call to 'transform_method' (usually 'fit_resample') replaces
+        both 'x' and 'y', so the sampler is neither run twice nor applied to
+        test data. If 'sample' is in 'memoized_steps', the resampled data is
+        cached by 'digest', so chapters and folds which pass identical data to
+        an identical sampler reuse it.
+
+        Args:
+            data ('Dataset'): instance with features and label to resample.
+            digest (Optional[str]): digest of the output from '_chain_digest'.
+                Defaults to None.
+
+        Returns:
+            'Dataset': with resampled features and label.
+
+        """
+        if data.stages.current in ['full']:
+            x, y = data.x, data.y
+        else:
+            x, y = data.x_train, data.y_train
+        if self._is_balanced(y = y):
+            if self.verbose:
+                print('Skipping', self.name, 'because classes are balanced')
+            return data
+        if digest is not None and self.step in self.memoized_steps:
+            x, y = self.memory.cache(
+                _resample_features,
+                ignore = ['technique', 'x', 'y'])(
+                    technique = self,
+                    digest = digest,
+                    x = x,
+                    y = y)
+        else:
+            x, y = self._fit_resample(x = x, y = y)
+        if data.stages.current in ['full']:
+            data.x, data.y = x, y
+        else:
+            data.x_train, data.y_train = x, y
+        return data
+
+    def _is_balanced(self, y: pd.Series) -> bool:
+        """Returns whether classes in 'y' are within 'balance_tolerance'.
+
+        Args:
+            y (pd.Series): dependent variable/label.
+
+        Returns:
+            bool: True if the smallest class count divided by the largest is
+                at least 'balance_tolerance'.
+
+        """
+        if self.balance_tolerance is None:
+            return False
+        counts = np.unique(np.asarray(y), return_counts = True)[1]
+        return counts.min() / counts.max() >= self.balance_tolerance
+
+    def _fit_resample(self,
+            x: pd.DataFrame,
+            y: pd.Series) -> Tuple[pd.DataFrame, pd.Series]:
+        """Resamples 'x' and 'y' with 'algorithm'.
+
+        For techniques with 'sparse' set, 'x' is passed as a CSR matrix if at
+        most 'max_sparse_density' of its values are nonzero. SMOTENC then
+        one-hot encodes categorical columns sparsely instead of building a
+        dense block for every synthetic sample, and neighbor searches only
+        read the nonzero values. The matrix is built column by column from
+        the nonzero values, and the resampled 'x' is returned as a sparse
+        DataFrame, so the dense array is never created.
+
+        Args:
+            x (pd.DataFrame): independent variables/features.
+            y (pd.Series): dependent variable/label.
+
+        Returns:
+            Tuple[pd.DataFrame, pd.Series]: resampled 'x' and 'y'.
+
+        """
+        resample = getattr(self.algorithm, self.transform_method)
+        if self.sparse:
+            nonzero = sum(self._count_nonzero(x[column]) for column in x)
+            if nonzero <= x.size * self.max_sparse_density:
+                resampled_x, resampled_y = resample(self._to_csr(x = x), y)
+                index = self._resampled_index(
+                    index = x.index,
+                    rows = resampled_x.shape[0])
+                return (
+                    self._from_csr(
+                        matrix = resampled_x,
+                        index = index,
+                        columns = x.columns),
+                    pd.Series(
+                        np.asarray(resampled_y),
+                        index = index,
+                        name = getattr(y, 'name', None)))
+        return resample(x, y)
+
+    def _count_nonzero(self, column: pd.Series) -> int:
+        """Returns the number of nonzero values in 'column'.
+
+        Args:
+            column (pd.Series): a single column of features.
+
+        Returns:
+            int: number of nonzero values in 'column'.
+
+        """
+        if self._is_zero_filled(column = column):
+            return np.count_nonzero(column.array.sp_values)
+        return np.count_nonzero(column.to_numpy())
+
+    def _is_zero_filled(self, column: pd.Series) -> bool:
+        """Returns whether 'column' is sparse with values left out being 0.
+
+        Args:
+            column (pd.Series): a single column of features.
+
+        Returns:
+            bool: whether only the nonzero values of 'column' need be read.
+
+        """
+        return (isinstance(column.dtype, pd.SparseDtype)
+            and column.array.fill_value == 0)
+
+    def _to_csr(self, x: pd.DataFrame) -> 'sparse.csr_matrix':
+        """Returns 'x' as a CSR matrix built from its nonzero values.
+
+        Columns are read one at a time, and sparse columns only through their
+        stored values, so no dense copy of 'x' is made.
+
+        Args:
+            x (pd.DataFrame): independent variables/features.
+
+        Returns:
+            sparse.csr_matrix: with the values of 'x'.
+
+        """
+        rows, columns, values = [], [], []
+        for position, name in enumerate(x):
+            column = x[name]
+            if self._is_zero_filled(column = column):
+                indices = column.array.sp_index.indices
+                stored = column.array.sp_values
+            else:
+                column = column.to_numpy()
+                indices = np.flatnonzero(column)
+                stored = column[indices]
+            kept = np.flatnonzero(stored)
+            rows.append(indices[kept])
+            values.append(stored[kept])
+            columns.append(np.full(len(kept), position))
+        return sparse.csr_matrix(
+            (np.concatenate(values), (np.concatenate(rows),
+                np.concatenate(columns))),
+            shape = x.shape)
+
+    def _from_csr(self,
+            matrix: 'sparse.spmatrix',
+            index: pd.Index,
+            columns: pd.Index) -> pd.DataFrame:
+        """Returns 'matrix' as a DataFrame of zero-filled sparse columns.
+
+        Columns are built one at a time because some pandas versions fill
+        the columns from 'DataFrame.sparse.from_spmatrix' with NaN.
+
+        Args:
+            matrix (sparse.spmatrix): resampled features.
+            index (pd.Index): index of the returned DataFrame.
+            columns (pd.Index): column names of the returned DataFrame.
+
+        Returns:
+            pd.DataFrame: with sparse columns holding the values of 'matrix'.
+
+        """
+        matrix = matrix.tocsc()
+        x = pd.DataFrame(
+            {position: pd.arrays.SparseArray.from_spmatrix(
+                matrix[:, [position]]) for position in range(len(columns))},
+            index = index)
+        x.columns = columns
+        return x
+
+    def _resampled_index(self, index: pd.Index, rows: int) -> pd.Index:
+        """Returns an index for 'rows' resampled from rows with 'index'.
+
+        Undersamplers store the positions of the rows they keep in
+        'sample_indices_'. Oversamplers return the original rows first, so
+        those keep their labels and synthetic rows are numbered after the
+        largest original label. Otherwise, rows are numbered from 0.
+
+        Args:
+            index (pd.Index): index of the features before resampling.
+            rows (int): number of resampled rows.
+
+        Returns:
+            pd.Index: for the resampled features and label.
+
+        """
+        kept = getattr(self.algorithm, 'sample_indices_', None)
+        if kept is not None and len(kept) == rows:
+            return index[kept]
+        elif (rows >= len(index) and len(index)
+                and pd.api.types.is_integer_dtype(index)):
+            start = index.max() + 1
+            return index.append(
+                pd.RangeIndex(start, start + rows - len(index)))
+        else:
+            return pd.RangeIndex(rows)
+
+    def _scale_array(self, x: pd.DataFrame) -> pd.DataFrame:
+        """Scales the array underlying 'x' rather than the DataFrame.
+
+        Scalers configured with 'copy' set to False then work on the single
+        array taken from 'x', and the result is wrapped with the index and
+        columns of 'x' without another copy. If 'dtype' is set, the array is
+        taken in that dtype.
+
+        Args:
+            x (pd.DataFrame): independent variables/features.
+
+        Returns:
+            pd.DataFrame: scaled 'x'.
+
+        """
+        return pd.DataFrame(
+            getattr(self.algorithm, self.transform_method)(
+                x.to_numpy(dtype = self.dtype)),
+            index = x.index,
+            columns = x.columns,
+            copy = False)
+
+    def _select_columns(self,
+            x: Union[pd.DataFrame, np.ndarray]) -> Union[
+                pd.DataFrame, np.ndarray]:
+        """Keeps the columns of 'x' chosen by a fitted feature selector.
+
+        The kept columns are gathered with a single integer index into the
+        underlying array, which also preserves the names of kept columns. The
+        indices stored in 'support_indices' by 'fit' are used when available.
+        If every column is kept, 'x' is returned without a copy.
+
+        Args:
+            x (Union[pd.DataFrame, np.ndarray]): independent variables/features.
+
+        Returns:
+            Union[pd.DataFrame, np.ndarray]: 'x' with only selected columns.
+
+        """
+        indices = self.support_indices
+        if indices is None:
+            indices = self.algorithm.get_support(indices = True)
+        if len(indices) == x.shape[1]:
+            return x
+        elif isinstance(x, pd.DataFrame):
+            return pd.DataFrame(
+                x.to_numpy()[:, indices],
+                index = x.index,
+                columns = x.columns[indices])
+        else:
+            return x[:, indices]
+
 
 """ Publisher Subclass """
 
@@ -214,13 +774,88 @@ class Analyst(Scholar):
     """Applies a 'Cookbook' instance to data.
 
     Args:
+        worker ('Worker'): instance with information needed to create a Book
+            instance.
+        name (Optional[str]): designates the name of the class which should
+            match the section of settings in the 'Idea' instance. Defaults to
+            'analyst'.
+        cache_fits (Optional[bool]): whether to cache fitted scalers,
+            selectors, and models on disk so that recipes which pass identical
+            data to identical algorithms reuse the earlier fit. Defaults to
+            False.
+        cache_limit (Optional[str]): maximum size of the model cache (e.g.
+            '1G'). Defaults to None, which means the cache is not reduced.
+        memoize_steps (Optional[Union[List[str], str]]): steps whose
+            transformed data is cached when 'cache_fits' is True, so chapters
+            sharing the same leading techniques reuse their output. Defaults
+            to None, which uses 'scale', 'encode', and 'sample'.
+        balance_tolerance (Optional[float]): ratio of the smallest to the
+            largest class count at or above which sample steps are skipped.
+            Defaults to None, which means data is always resampled.
+        search_subsample (Optional[float]): fraction of rows used to screen
+            search candidates before the best are refit on all rows. Defaults
+            to None, which means every candidate is fit on all rows.
+        search_finalists (Optional[int]): number of screened candidates which
+            are cross-validated on all rows. Defaults to 5.
+        memmap_data (Optional[bool]): whether 'x' and 'y' are stored once as
+            float32 in read-only memory-mapped files, from which every chapter
+            starts, when chapters are applied serially. They are always
+            memory-mapped when 'parallelize' is True. Defaults to False.
         idea (ClassVar['Idea']): an 'Idea' instance with project settings.
 
     """
+    worker: Optional['Worker'] = None
+    name: Optional[str] = field(default_factory = lambda: 'analyst')
+    cache_fits: Optional[bool] = False
+    cache_limit: Optional[str] = None
+    memoize_steps: Optional[Union[List[str], str]] = None
+    balance_tolerance: Optional[float] = None
+    search_subsample: Optional[float] = None
+    search_finalists: Optional[int] = 5
+    memmap_data: Optional[bool] = False
     idea: ClassVar['Idea']
+    min_search_rows: ClassVar[int] = 1000
+
+    def __post_init__(self) -> None:
+        """Initializes class instance attributes."""
+        super().__post_init__()
+        self._draft_memory()
+        self._draft_search()
+        return self
 
     """ Private Methods """
 
+    def _draft_memory(self) -> None:
+        """Creates 'Memory' instance for caching fitted algorithms."""
+        if self.cache_fits:
+            self.memory = Memory(
+                location = self.inventory['results'].joinpath('cache'),
+                verbose = 0)
+        else:
+            self.memory = None
+        self.data_digest = None
+        self.prefix_states = []
+        # Feature scores are shared by the scorers of every chapter in a run.
+        self.scores = {}
+        return self
+
+    def _draft_search(self) -> None:
+        """Stores the metric which picks the best search candidate.
+
+        Searches which refit the best candidate need a single 'scoring'
+        metric, so the first of the 'scoring' settings is found once instead
+        of in every search.
+
+        """
+        try:
+            scoring = self.idea['search_parameters']['scoring']
+        except KeyError:
+            scoring = None
+        if isinstance(scoring, (list, tuple)):
+            scoring = scoring[0]
+        self.primary_metric = scoring
+        return self
+
     def _finalize_chapters(self, book: 'Book', data: 'Dataset') -> 'Book':
         """Finalizes 'Chapter' instances in 'Book'.
 
@@ -239,6 +874,7 @@ class Analyst(Scholar):
             new_techniques = []
             for technique in chapter.techniques:
                 if not technique.name in ['none']:
+                    technique = self._add_settings(technique = technique)
                     new_technique = self._add_conditionals(
                         book = book,
                         technique = technique,
@@ -249,8 +885,47 @@ class Analyst(Scholar):
                     new_techniques.append(self._add_parameters_to_algorithm(
                         technique = technique))
             chapter.techniques = new_techniques
+            self._divide_chapter(chapter = chapter)
         return book
 
+    def _add_settings(self, technique: 'Technique') -> 'Technique':
+        """Copies per-run caching and sampling settings to 'technique'.
+
+        Args:
+            technique ('Technique'): instance to apply in this run.
+
+        Returns:
+            'Technique': with the settings of this 'Analyst'.
+
+        """
+        technique.memory = self.memory
+        if self.memoize_steps is not None:
+            technique.memoized_steps = tuple(listify(self.memoize_steps))
+        technique.balance_tolerance = self.balance_tolerance
+        technique.verbose = self.verbose
+        return technique
+
+    def _divide_chapter(self, chapter: 'Chapter') -> None:
+        """Stores 'techniques' before and after the split step as tuples.
+
+        The split point is found once so that '_apply_chapter' and the per-fold
+        loop in '_split_loop' iterate fixed tuples.
+
+        Args:
+            chapter ('Chapter'): instance with finalized 'techniques'.
+
+        """
+        steps = [technique.step for technique in chapter.techniques]
+        try:
+            index = steps.index('split')
+            chapter.pre_split = tuple(chapter.techniques[:index])
+            chapter.split = chapter.techniques[index]
+            chapter.post_split = tuple(chapter.techniques[index + 1:])
+        except ValueError:
+            chapter.pre_split = tuple(chapter.techniques)
+            chapter.split = None
+            chapter.post_split = ()
+
     def _apply_chapter(self,
             chapter: 'Chapter',
             data: Union['Dataset']) -> 'Chapter':
@@ -266,36 +941,107 @@ class Analyst(Scholar):
                 attribute of 'data'.
 
         """
-        data.create_xy()
-        for i, technique in enumerate(chapter.techniques):
-            if technique.step in ['split']:
-                chapter, data = self._split_loop(
-                    chapter = chapter,
-                    index = i,
-                    data = data)
-                break
-            elif technique.step in ['search']:
-                remaining = self._search_loop(
-                    steps = remaining,
-                    index = i,
-                    data = data)
-                data = technique.apply(data = data)
-            elif not technique.name in ['none', None]:
-                data = technique.apply(data = data)
+        # Memory-mapped 'x' and 'y' are already fresh in each worker process.
+        shared = self.parallelize and data.full_bunch.memmapped
+        if shared:
+            techniques = chapter.pre_split
+            data.digest = self._root_digest(data = data)
+        else:
+            techniques = self._restore_prefix(chapter = chapter, data = data)
+        for technique in techniques:
+            if not shared:
+                self._protect_prefix(data = data)
+            key = (technique.step, technique.name, technique.parameters)
+            if technique.parameter_space:
+                technique = self._search_loop(technique = technique, data = data)
+            data = technique.apply(data = data)
+            if not shared:
+                self.prefix_states.append((key, data.x, data.y, data.digest))
+        if chapter.split is not None:
+            chapter, data = self._split_loop(chapter = chapter, data = data)
         setattr(chapter, 'data', data)
         return chapter
 
+    def _root_digest(self, data: 'Dataset') -> Optional[str]:
+        """Returns the digest of 'x' and 'y', hashing them only once.
+
+        Args:
+            data ('Dataset'): instance with 'x' and 'y' created.
+
+        Returns:
+            Optional[str]: digest which each step extends, or None if there is
+                no shared 'memory'.
+
+        """
+        if self.memory is not None and self.data_digest is None:
+            self.data_digest = joblib.hash((data.x, data.y))
+        return self.data_digest
+
+    def _restore_prefix(self,
+            chapter: 'Chapter',
+            data: 'Dataset') -> Tuple['Technique', ...]:
+        """Resumes 'data' after the techniques shared with the last chapter.
+
+        Chapters are drafted in the order of the Cartesian product of
+        techniques, so neighboring chapters usually share their leading
+        techniques. 'prefix_states' holds 'x' and 'y' as first split from the
+        data and after each technique applied before the split in the last
+        chapter. 'data' is restored to the deepest state whose techniques
+        match those of 'chapter', which walks the prefix tree of chapters
+        depth-first while holding at most one state per step. 'x' and 'y' are
+        only split from the data for the first chapter, unless they are
+        already memory-mapped.
+
+        Args:
+            chapter ('Chapter'): instance with 'pre_split' techniques.
+            data ('Dataset'): instance to restore.
+
+        Returns:
+            Tuple['Technique', ...]: techniques in 'pre_split' which have not
+                been applied to 'data'.
+
+        """
+        if not self.prefix_states:
+            if not data.full_bunch.memmapped:
+                data.create_xy()
+            self.prefix_states.append(
+                (None, data.x, data.y, self._root_digest(data = data)))
+        depth = 0
+        for technique, state in zip(chapter.pre_split, self.prefix_states[1:]):
+            key = (technique.step, technique.name, technique.parameters)
+            if key != state[0]:
+                break
+            depth += 1
+        del self.prefix_states[depth + 1:]
+        _, data.x, data.y, data.digest = self.prefix_states[-1]
+        data.stages.change('full')
+        return chapter.pre_split[depth:]
+
+    def _protect_prefix(self, data: 'Dataset') -> None:
+        """Copies 'x' and 'y' if they are the last state in 'prefix_states'.
+
+        Some techniques (e.g. scalers with 'copy' set to False) change 'x' in
+        place, so a stored state is copied just before another technique is
+        applied to it. The split loop only slices 'x' and 'y', so states are
+        not copied when they are restored.
+
+        Args:
+            data ('Dataset'): instance about to be passed to a technique.
+
+        """
+        if self.prefix_states and data.x is self.prefix_states[-1][1]:
+            data.x = data.x.copy()
+            data.y = data.y.copy()
+
     def _split_loop(self,
             chapter: 'Chapter',
-            index: int,
             data: 'DataSet') -> ('Chapter', 'Dataset'):
         """Splits 'data' and applies remaining steps in 'chapter'.
 
         Args:
-            chapter ('Chapter'): instance with 'steps' to apply to 'data'.
-            index (int): number of step in 'chapter' 'steps' where split method
-                is located. All subsequent steps are completed with data split
-                into training and testing sets.
+            chapter ('Chapter'): instance with 'split' and 'post_split'
+                techniques to apply to 'data'. All 'post_split' techniques are
+                completed with data split into training and testing sets.
             data ('Dataset'): data object for 'chapter' to be applied.
 
         Return:
@@ -303,35 +1049,158 @@ class Analyst(Scholar):
 
         """
         data.stages.change('testing')
-        split_algorithm = chapter.techniques[index].algorithm
-        for train_index, test_index in split_algorithm.split(data.x, data.y):
-            data.x_train = data.x.iloc[train_index]
-            data.x_test = data.x.iloc[test_index]
-            data.y_train = data.y[train_index]
-            data.y_test = data.y[test_index]
-            for technique in chapter.techniques[index + 1:]:
-                if not technique.name in ['none', None]:
-                    data = technique.apply(data = data)
+        split_algorithm = chapter.split.algorithm
+        x, y = data.x, data.y
+        train_mask = np.zeros(len(x), dtype = bool)
+        test_mask = np.zeros(len(x), dtype = bool)
+        split_digest = chapter.split._chain_digest(data = data)
+        for fold, (train_index, test_index) in enumerate(
+                split_algorithm.split(x, y)):
+            # Boolean masks avoid pandas positional lookups on every slice.
+            # Separate masks are kept because some splitters (e.g.
+            # TimeSeriesSplit) do not use every row in each fold.
+            train_mask[:] = False
+            train_mask[train_index] = True
+            test_mask[:] = False
+            test_mask[test_index] = True
+            data.x_train = x[train_mask]
+            data.x_test = x[test_mask]
+            data.y_train = y[train_mask]
+            data.y_test = y[test_mask]
+            if split_digest is not None:
+                data.digest = joblib.hash((split_digest, fold))
+            for technique in chapter.post_split:
+                if technique.parameter_space:
+                    technique = self._search_loop(
+                        technique = technique,
+                        data = data)
+                data = technique.apply(data = data)
         return chapter, data
 
     def _search_loop(self,
-            chapter: 'Chapter',
-            index: int,
-            data: 'DataSet') -> ('Chapter', 'Dataset'):
+            technique: 'Technique',
+            data: 'DataSet') -> 'Technique':
         """Searches hyperparameters for a particular 'algorithm'.
 
+        The search technique is selected by the 'search_method' setting and
+        is configured with the 'search_parameters' section of 'idea'.
+
         Args:
-            chapter ('Chapter'): instance with 'steps' to apply to 'data'.
-            index (int): number of step in 'chapter' 'steps' where the search
-                method should be applied
-            data ('Dataset'): data object for 'chapter' to be applied.
+            technique ('Technique'): instance with an instanced 'algorithm'
+                and a 'parameter_space' to search.
+            data ('Dataset'): data object with the data to search with.
 
         Return:
-            'Chapter': with the searched step modified with the best found
-                hyperparameters.
+            'Technique': with 'algorithm' replaced by the best found estimator.
+                'parameter_space' is cleared so that later folds of the same
+                chapter reuse the result. Every chapter is published with its
+                own copy of 'technique', so other chapters run their own
+                search.
 
         """
-        return chapter
+        search_method = self.idea['analyst']['search_method']
+        if search_method in ['bayes'] and self.idea['general']['gpu']:
+            search_method = 'bayes_gpu'
+        search = self.worker.options['search'][search_method]
+        parameters = deepcopy(search.default)
+        parameters.update(self.idea['search_parameters'])
+        # Limits settings to those the search technique accepts.
+        if search.selected:
+            parameters = {key: parameters[key] for key in search.default}
+        if parameters.get('refit'):
+            parameters['scoring'] = self.primary_metric
+        estimator = technique.algorithm
+        # Fits each candidate on one core while candidates run in parallel.
+        if parameters.get('n_jobs') and 'n_jobs' in estimator.get_params():
+            estimator = clone(estimator).set_params(n_jobs = 1)
+        parameters.update({
+            'estimator': estimator,
+            'param_distributions': technique.parameter_space,
+            'random_state': self.seed})
+        if data.stages.current in ['full']:
+            x, y = data.x, data.y
+        else:
+            x, y = data.x_train, data.y_train
+        if (self.search_subsample and parameters.get('refit')
+                and len(x) * self.search_subsample >= self.min_search_rows):
+            searcher = partial(
+                self._search_subsample,
+                search = search,
+                parameters = parameters)
+            settings = (search.name, parameters, self.search_subsample,
+                self.search_finalists)
+        else:
+            searcher = partial(
+                _fit_algorithm,
+                search.load('algorithm')(**parameters))
+            settings = (search.name, parameters)
+        # Reuses the search of an earlier chapter with identical data.
+        if self.memory is not None and data.digest is not None:
+            search_estimator = self.memory.cache(
+                _search_estimator,
+                ignore = ['searcher', 'x', 'y'])
+        else:
+            search_estimator = _search_estimator
+        best_estimator, best_parameters = search_estimator(
+            searcher = searcher,
+            digest = data.digest,
+            settings = settings,
+            x = x,
+            y = y)
+        if estimator is not technique.algorithm:
+            best_estimator.set_params(
+                n_jobs = technique.algorithm.get_params()['n_jobs'])
+        technique.algorithm = best_estimator
+        technique.parameters.update(best_parameters)
+        technique.parameter_space = {}
+        return technique
+
+    def _search_subsample(self,
+            search: 'Technique',
+            parameters: Dict[str, Any],
+            x: pd.DataFrame,
+            y: pd.Series) -> object:
+        """Screens candidates on a subsample and refits the best on all rows.
+
+        The search runs on a 'search_subsample' fraction of rows (stratified
+        for classifiers). Only the 'search_finalists' best settings are then
+        cross-validated on all of 'x' and 'y'.
+
+        Args:
+            search ('Technique'): search technique from 'options'.
+            parameters (Dict[str, Any]): parameters for the search algorithm.
+            x (pd.DataFrame): independent variables/features.
+            y (pd.Series): dependent variable/label.
+
+        Returns:
+            object: fitted 'GridSearchCV' over the finalists.
+
+        """
+        if self.idea['analyst']['model_type'] in ['classify']:
+            splitter = StratifiedShuffleSplit
+        else:
+            splitter = ShuffleSplit
+        rows = next(splitter(
+            n_splits = 1,
+            train_size = self.search_subsample,
+            random_state = self.seed).split(x, y))[0]
+        screen = search.load('algorithm')(**parameters).fit(
+            x.iloc[rows],
+            y.iloc[rows])
+        scores = np.nan_to_num(
+            screen.cv_results_['mean_test_score'],
+            nan = -np.inf)
+        finalists = [
+            {key: [value] for key, value in
+                screen.cv_results_['params'][index].items()}
+            for index in np.argsort(scores)[::-1][:self.search_finalists]]
+        return GridSearchCV(
+            estimator = parameters['estimator'],
+            param_grid = finalists,
+            scoring = parameters.get('scoring'),
+            cv = parameters.get('cv'),
+            refit = True,
+            n_jobs = parameters.get('n_jobs')).fit(x, y)
 
     def _add_model_conditionals(self,
             technique: 'Technique',
@@ -350,12 +1219,87 @@ class Analyst(Scholar):
         self._model_calculate_hyperparameters(
             technique = technique,
             data = data)
-        if technique.name in ['xgboost'] and self.idea['general']['gpu']:
-            technique.parameters['tree_method'] = 'gpu_exact'
-        elif step in ['tensorflow']:
-            technique.algorithm = algorithms.make_tensorflow_model(
-                technique = technique,
-                data = data)
+        return _MODEL_CONDITIONALS.get(technique.name, _no_conditionals)(
+            technique = technique,
+            data = data,
+            gpu = self.idea['general']['gpu'])
+
+    def _add_reduce_conditionals(self,
+            technique: 'Technique',
+            data: 'Dataset') -> 'Technique':
+        """Replaces a 'score_func' name with its memoized scoring function.
+
+        Args:
+            technique ('Technique'): an instance with 'algorithm' and
+                'parameters' not yet combined.
+            data ('Dataset'): data object used to derive hyperparameters.
+
+        Returns:
+            'Technique': with any applicable parameters added.
+
+        """
+        score_func = technique.parameters.get('score_func')
+        if isinstance(score_func, str):
+            score_func = getattr(
+                import_module('sklearn.feature_selection'),
+                _REDUCE_SCORERS[score_func])
+        if callable(score_func) and not isinstance(
+                score_func, algorithms.CachedScorer):
+            technique.parameters['score_func'] = algorithms.CachedScorer(
+                score_func = score_func,
+                scores = self.scores)
+        return technique
+
+    def _add_sample_conditionals(self,
+            technique: 'Technique',
+            data: 'Dataset') -> 'Technique':
+        """Forwards the idea's 'n_jobs' to samplers and their neighbor searches.
+
+        'AllKNN', 'NearMiss', 'SMOTEENN' and 'SMOTETomek' take 'n_jobs'
+        directly. 'SMOTE', 'SMOTENC' and 'ADASYN' deprecated theirs, so their
+        required neighbor counts are replaced with a prebuilt
+        'NearestNeighbors', which counts the sample itself as one extra
+        neighbor. Either way, 'n_jobs' comes from 'search_parameters' in the
+        idea and defaults to -1.
+
+        Args:
+            technique ('Technique'): an instance with 'algorithm' and
+                'parameters' not yet combined.
+            data ('Dataset'): data object used to derive hyperparameters.
+
+        Returns:
+            'Technique': with any applicable parameters added.
+
+        """
+        from sklearn.neighbors import NearestNeighbors
+        n_jobs = (self.idea['search_parameters'] or {}).get('n_jobs', -1)
+        if technique.name in ['knn', 'near_miss', 'smoteenn', 'smotetomek']:
+            technique.parameters['n_jobs'] = n_jobs
+        for key in ['k_neighbors', 'n_neighbors']:
+            if key in (technique.required or {}) and isinstance(
+                    technique.parameters.get(key), int):
+                technique.parameters[key] = NearestNeighbors(
+                    n_neighbors = technique.parameters[key] + 1,
+                    n_jobs = n_jobs)
+        return technique
+
+    def _add_split_conditionals(self,
+            technique: 'Technique',
+            data: 'Dataset') -> 'Technique':
+        """Stratifies a single train/test split only for classification.
+
+        Args:
+            technique ('Technique'): an instance with 'algorithm' and
+                'parameters' not yet combined.
+            data ('Dataset'): data object used to derive hyperparameters.
+
+        Returns:
+            'Technique': with any applicable parameters added.
+
+        """
+        if technique.name in ['train_test']:
+            technique.parameters['stratify'] = (
+                self.idea['analyst']['model_type'] in ['classify'])
         return technique
 
     def _model_calculate_hyperparameters(self,
@@ -381,14 +1325,801 @@ class Analyst(Scholar):
         """
         if (technique.name in ['xgboost']
                 and self.idea['analyst']['calculate_hyperparameters']):
+            if data.y is None:
+                y = data.data[self.idea['analyst']['label']].to_numpy()
+            else:
+                y = data.y.to_numpy()
             technique.parameters['scale_pos_weight'] = (
-                    len(self.data['y'].index) /
-                    ((self.data['y'] == 1).sum())) - 1
+                y.size / np.count_nonzero(y == 1)) - 1
         return self
 
+    """ Core siMpLify Methods """
+
+    def apply(self,
+            worker: str,
+            project: 'Project',
+            data: 'Dataset',
+            **kwargs) -> ('Project', 'Dataset'):
+        """Applies 'Cookbook' instance in 'project' to 'data'.
+
+        Args:
+            worker (str): key to 'Cookbook' instance to apply in 'project'.
+            project ('Project): instance with stored 'Cookbook' instances.
+            data ('Dataset'): instance with data for 'Cookbook' to be applied.
+            kwargs: any additional parameters to pass.
+
+        Returns:
+            Tuple('Project', 'Data'): instances with any necessary modifications
+                made.
+
+        """
+        self.data_digest = None
+        self.prefix_states = []
+        if self.parallelize or self.memmap_data:
+            data.memmap_xy(folder = self.inventory['results'])
+        project, data = super().apply(
+            worker = worker,
+            project = project,
+            data = data,
+            **kwargs)
+        if self.memory is not None and self.cache_limit:
+            self.memory.reduce_size(bytes_limit = self.cache_limit)
+        return project, data
+
+
+""" Conditional Parameters """
+
+def _no_conditionals(
+        technique: 'Technique',
+        data: 'Dataset',
+        gpu: bool) -> 'Technique':
+    """Returns 'technique' unchanged."""
+    return technique
+
+def _xgboost_conditionals(
+        technique: 'Technique',
+        data: 'Dataset',
+        gpu: bool) -> 'Technique':
+    """Selects the xgboost tree method and device for 'gpu'."""
+    if gpu:
+        # 'gpu_exact' and 'gpu_hist' were removed in xgboost 2.0, which builds
+        # histograms on the GPU when 'device' is set instead.
+        technique.parameters.update({'tree_method': 'hist', 'device': 'cuda'})
+    return technique
+
+def _tensorflow_conditionals(
+        technique: 'Technique',
+        data: 'Dataset',
+        gpu: bool) -> 'Technique':
+    """Builds the tensorflow model for 'technique' from 'data'."""
+    technique.algorithm = algorithms.make_tensorflow_model(
+        technique = technique,
+        data = data)
+    return technique
+
+
+_MODEL_CONDITIONALS = MappingProxyType({
+    'tensorflow': _tensorflow_conditionals,
+    'xgboost': _xgboost_conditionals})
+
 
 """ Options """
 
+_MODEL_OPTIONS = MappingProxyType({
+    'classify': MappingProxyType({
+        'adaboost': AnalystTechnique(
+            name = 'adaboost',
+            module = 'sklearn.ensemble',
+            algorithm = 'AdaBoostClassifier',
+            transform_method = None),
+        'baseline_classifier': AnalystTechnique(
+            name = 'baseline_classifier',
+            module = 'sklearn.dummy',
+            algorithm = 'DummyClassifier',
+            required = {'strategy': 'most_frequent'},
+            transform_method = None),
+        'logit': AnalystTechnique(
+            name = 'logit',
+            module = 'sklearn.linear_model',
+            algorithm = 'LogisticRegression',
+            transform_method = None,
+            dtype = 'float32'),
+        'random_forest': AnalystTechnique(
+            name = 'random_forest',
+            module = 'sklearn.ensemble',
+            algorithm = 'RandomForestClassifier',
+            transform_method = None),
+        'svm_linear': AnalystTechnique(
+            name = 'svm_linear',
+            module = 'sklearn.svm',
+            algorithm = 'SVC',
+            required = {'kernel': 'linear', 'probability': True},
+            transform_method = None,
+            dtype = 'float32'),
+        'svm_poly': AnalystTechnique(
+            name = 'svm_poly',
+            module = 'sklearn.svm',
+            algorithm = 'SVC',
+            required = {'kernel': 'poly', 'probability': True},
+            transform_method = None,
+            dtype = 'float32'),
+        'svm_rbf': AnalystTechnique(
+            name = 'svm_rbf',
+            module = 'sklearn.svm',
+            algorithm = 'SVC',
+            required = {'kernel': 'rbf', 'probability': True},
+            transform_method = None,
+            dtype = 'float32'),
+        'svm_sigmoid': AnalystTechnique(
+            name = 'svm_sigmoid',
+            module = 'sklearn.svm',
+            algorithm = 'SVC',
+            required = {'kernel': 'sigmoid', 'probability': True},
+            transform_method = None,
+            dtype = 'float32'),
+        'tensorflow': AnalystTechnique(
+            name = 'tensorflow',
+            module = 'tensorflow',
+            algorithm = None,
+            default = {
+                'batch_size': 10,
+                'epochs': 2},
+            transform_method = None),
+        'xgboost': AnalystTechnique(
+            name = 'xgboost',
+            module = 'xgboost',
+            algorithm = 'XGBClassifier',
+            default = {'tree_method': 'hist', 'n_jobs': -1},
+            # data_dependent = 'scale_pos_weight',
+            transform_method = None)}),
+    'cluster': MappingProxyType({
+        'affinity': AnalystTechnique(
+            name = 'affinity',
+            module = 'sklearn.cluster',
+            algorithm = 'AffinityPropagation',
+            required = {'affinity': 'precomputed'},
+            transform_method = None,
+            precompute = 'similarities'),
+        'agglomerative': AnalystTechnique(
+            name = 'agglomerative',
+            module = 'sklearn.cluster',
+            algorithm = 'AgglomerativeClustering',
+            required = {'metric': 'precomputed', 'linkage': 'average'},
+            transform_method = None,
+            precompute = 'distances'),
+        'birch': AnalystTechnique(
+            name = 'birch',
+            module = 'sklearn.cluster',
+            algorithm = 'Birch',
+            transform_method = None),
+        'dbscan': AnalystTechnique(
+            name = 'dbscan',
+            module = 'sklearn.cluster',
+            algorithm = 'DBSCAN',
+            transform_method = None),
+        'kmeans': AnalystTechnique(
+            name = 'kmeans',
+            module = 'sklearn.cluster',
+            algorithm = 'KMeans',
+            transform_method = None),
+        'mean_shift': AnalystTechnique(
+            name = 'mean_shift',
+            module = 'sklearn.cluster',
+            algorithm = 'MeanShift',
+            transform_method = None),
+        'spectral': AnalystTechnique(
+            name = 'spectral',
+            module = 'sklearn.cluster',
+            algorithm = 'SpectralClustering',
+            required = {'affinity': 'precomputed_nearest_neighbors'},
+            transform_method = None,
+            precompute = 'distances'),
+        'svm_linear': AnalystTechnique(
+            name = 'svm_linear',
+            module = 'sklearn.svm',
+            algorithm = 'OneClassSVM',
+            required = {'kernel': 'linear'},
+            transform_method = None),
+        'svm_poly': AnalystTechnique(
+            name = 'svm_poly',
+            module = 'sklearn.svm',
+            algorithm = 'OneClassSVM',
+            required = {'kernel': 'poly'},
+            transform_method = None),
+        'svm_rbf': AnalystTechnique(
+            name = 'svm_rbf',
+            module = 'sklearn.svm',
+            algorithm = 'OneClassSVM',
+            required = {'kernel': 'rbf'},
+            transform_method = None),
+        'svm_sigmoid': AnalystTechnique(
+            name = 'svm_sigmoid',
+            module = 'sklearn.svm',
+            algorithm = 'OneClassSVM',
+            required = {'kernel': 'sigmoid'},
+            transform_method = None)}),
+    'regress': MappingProxyType({
+        'adaboost': AnalystTechnique(
+            name = 'adaboost',
+            module = 'sklearn.ensemble',
+            algorithm = 'AdaBoostRegressor',
+            transform_method = None),
+        'baseline_regressor': AnalystTechnique(
+            name = 'baseline_regressor',
+            module = 'sklearn.dummy',
+            algorithm = 'DummyRegressor',
+            required = {'strategy': 'mean'},
+            transform_method = None),
+        'bayes_ridge': AnalystTechnique(
+            name = 'bayes_ridge',
+            module = 'sklearn.linear_model',
+            algorithm = 'BayesianRidge',
+            transform_method = None),
+        'lasso': AnalystTechnique(
+            name = 'lasso',
+            module = 'sklearn.linear_model',
+            algorithm = 'Lasso',
+            transform_method = None),
+        'lasso_lars': AnalystTechnique(
+            name = 'lasso_lars',
+            module = 'sklearn.linear_model',
+            algorithm = 'LassoLars',
+            transform_method = None),
+        'ols': AnalystTechnique(
+            name = 'ols',
+            module = 'sklearn.linear_model',
+            algorithm = 'LinearRegression',
+            transform_method = None),
+        'random_forest': AnalystTechnique(
+            name = 'random_forest',
+            module = 'sklearn.ensemble',
+            algorithm = 'RandomForestRegressor',
+            transform_method = None),
+        'ridge': AnalystTechnique(
+            name = 'ridge',
+            module = 'sklearn.linear_model',
+            algorithm = 'Ridge',
+            transform_method = None),
+        'svm_linear': AnalystTechnique(
+            name = 'svm_linear',
+            module = 'sklearn.svm',
+            algorithm = 'SVC',
+            required = {'kernel': 'linear', 'probability': True},
+            transform_method = None,
+            dtype = 'float32'),
+        'svm_poly': AnalystTechnique(
+            name = 'svm_poly',
+            module = 'sklearn.svm',
+            algorithm = 'SVC',
+            required = {'kernel': 'poly', 'probability': True},
+            transform_method = None,
+            dtype = 'float32'),
+        'svm_rbf': AnalystTechnique(
+            name = 'svm_rbf',
+            module = 'sklearn.svm',
+            algorithm = 'SVC',
+            required = {'kernel': 'rbf', 'probability': True},
+            transform_method = None,
+            dtype = 'float32'),
+        'svm_sigmoid': AnalystTechnique(
+            name = 'svm_sigmoid',
+            module = 'sklearn.svm',
+            algorithm = 'SVC',
+            required = {'kernel': 'sigmoid', 'probability': True},
+            transform_method = None,
+            dtype = 'float32'),
+        'xgboost': AnalystTechnique(
+            name = 'xgboost',
+            module = 'xgboost',
+            algorithm = 'XGBRegressor',
+            default = {'tree_method': 'hist', 'n_jobs': -1},
+            # data_dependent = 'scale_pos_weight',
+            transform_method = None)})})
+
+
+_GPU_MODEL_OPTIONS = MappingProxyType({
+    'classify': MappingProxyType({
+        'forest_inference': AnalystTechnique(
+            name = 'forest_inference',
+            module = 'cuml',
+            algorithm = 'ForestInference',
+            transform_method = None),
+        'random_forest': AnalystTechnique(
+            name = 'random_forest',
+            module = 'cuml',
+            algorithm = 'RandomForestClassifier',
+            transform_method = None),
+        'logit': AnalystTechnique(
+            name = 'logit',
+            module = 'cuml',
+            algorithm = 'LogisticRegression',
+            transform_method = None)}),
+    'cluster': MappingProxyType({
+        'dbscan': AnalystTechnique(
+            name = 'dbscan',
+            module = 'cuml',
+            algorithm = 'DBSCAN',
+            transform_method = None),
+        'kmeans': AnalystTechnique(
+            name = 'kmeans',
+            module = 'cuml',
+            algorithm = 'KMeans',
+            transform_method = None)}),
+    'regress': MappingProxyType({
+        'lasso': AnalystTechnique(
+            name = 'lasso',
+            module = 'cuml',
+            algorithm = 'Lasso',
+            transform_method = None),
+        'ols': AnalystTechnique(
+            name = 'ols',
+            module = 'cuml',
+            algorithm = 'LinearRegression',
+            transform_method = None),
+        'ridge': AnalystTechnique(
+            name = 'ridge',
+            module = 'cuml',
+            algorithm = 'RidgeRegression',
+            transform_method = None)})})
+
+
+_REDUCE_OPTIONS = MappingProxyType({
+    'kbest': AnalystTechnique(
+        name = 'kbest',
+        module = 'sklearn.feature_selection',
+        algorithm = 'SelectKBest',
+        default = {'k': 10, 'score_func': 'f_classif'},
+        selected = True),
+    'fdr': AnalystTechnique(
+        name = 'fdr',
+        module = 'sklearn.feature_selection',
+        algorithm = 'SelectFdr',
+        default = {'alpha': 0.05, 'score_func': 'f_classif'},
+        selected = True),
+    'fpr': AnalystTechnique(
+        name = 'fpr',
+        module = 'sklearn.feature_selection',
+        algorithm = 'SelectFpr',
+        default = {'alpha': 0.05, 'score_func': 'f_classif'},
+        selected = True),
+    'custom': AnalystTechnique(
+        name = 'custom',
+        module = 'sklearn.feature_selection',
+        algorithm = 'SelectFromModel',
+        default = {'threshold': 'mean'},
+        runtime = {'estimator': 'algorithm'},
+        selected = True),
+    'rank': AnalystTechnique(
+        name = 'rank',
+        module = 'simplify.critic.rank',
+        algorithm = 'RankSelect',
+        selected = True),
+    'rfe': AnalystTechnique(
+        name = 'rfe',
+        module = 'sklearn.feature_selection',
+        algorithm = 'RFE',
+        default = {'n_features_to_select': 10, 'step': 0.05},
+        runtime = {'estimator': 'algorithm'},
+        selected = True),
+    'rfecv': AnalystTechnique(
+        name = 'rfecv',
+        module = 'sklearn.feature_selection',
+        algorithm = 'RFECV',
+        default = {'min_features_to_select': 10, 'step': 0.05},
+        required = {'n_jobs': -1},
+        runtime = {'estimator': 'algorithm'},
+        selected = True)})
+
+
+# Names of scoring functions in sklearn.feature_selection, which is only
+# imported once a selector is published.
+_REDUCE_SCORERS = MappingProxyType({
+    'chi2': 'chi2',
+    'f_classif': 'f_classif',
+    'f_regression': 'f_regression',
+    'mutual_class': 'mutual_info_classif',
+    'mutual_regress': 'mutual_info_regression'})
+
+
+_STEP_OPTIONS = MappingProxyType({
+    'fill': {
+        'defaults': AnalystTechnique(
+            name = 'defaults',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'smart_fill',
+            default = {'defaults': {
+                'boolean': False,
+                'float': 0.0,
+                'integer': 0,
+                'string': '',
+                'categorical': '',
+                'list': [],
+                'datetime': 1/1/1900,
+                'timedelta': 0}}),
+        'impute': AnalystTechnique(
+            name = 'defaults',
+            module = 'sklearn.impute',
+            algorithm = 'SimpleImputer',
+            default = {'defaults': {}}),
+        'knn_impute': AnalystTechnique(
+            name = 'defaults',
+            module = 'sklearn.impute',
+            algorithm = 'KNNImputer',
+            default = {'defaults': {}})},
+    'categorize': {
+        'automatic': AnalystTechnique(
+            name = 'automatic',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'auto_categorize',
+            default = {'threshold': 10}),
+        'binary': AnalystTechnique(
+            name = 'binary',
+            module = 'sklearn.preprocessing',
+            algorithm = 'Binarizer',
+            default = {'threshold': 0.5}),
+        'bins': AnalystTechnique(
+            name = 'bins',
+            module = 'sklearn.preprocessing',
+            algorithm = 'KBinsDiscretizer',
+            default = {
+                'strategy': 'uniform',
+                'n_bins': 5},
+            selected = True,
+            required = {'encode': 'onehot'})},
+    'scale': {
+        'gauss': AnalystTechnique(
+            name = 'gauss',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'Gaussify',
+            default = {
+                'standardize': False,
+                'copy': False,
+                'subsample': 100000},
+            selected = True,
+            required = {'rescaler': 'standard'},
+            runtime = {'random_state': 'seed'},
+            column_jobs = -1),
+        'maxabs': AnalystTechnique(
+            name = 'maxabs',
+            module = 'sklearn.preprocessing',
+            algorithm = 'MaxAbsScaler',
+            default = {'copy': False},
+            selected = True,
+            dtype = 'float32'),
+        'minmax': AnalystTechnique(
+            name = 'minmax',
+            module = 'sklearn.preprocessing',
+            algorithm = 'MinMaxScaler',
+            default = {'copy': False},
+            selected = True,
+            dtype = 'float32'),
+        'normalize': AnalystTechnique(
+            name = 'normalize',
+            module = 'sklearn.preprocessing',
+            algorithm = 'Normalizer',
+            default = {'copy': False},
+            selected = True,
+            dtype = 'float32'),
+        'quantile': AnalystTechnique(
+            name = 'quantile',
+            module = 'sklearn.preprocessing',
+            algorithm = 'QuantileTransformer',
+            default = {'copy': False},
+            selected = True,
+            column_jobs = -1),
+        'robust': AnalystTechnique(
+            name = 'robust',
+            module = 'sklearn.preprocessing',
+            algorithm = 'RobustScaler',
+            default = {'copy': False},
+            selected = True,
+            dtype = 'float32',
+            column_jobs = -1),
+        'standard': AnalystTechnique(
+            name = 'standard',
+            module = 'sklearn.preprocessing',
+            algorithm = 'StandardScaler',
+            default = {'copy': False},
+            selected = True,
+            dtype = 'float32')},
+    'split': {
+        'group_kfold': AnalystTechnique(
+            name = 'group_kfold',
+            module = 'sklearn.model_selection',
+            algorithm = 'GroupKFold',
+            default = {'n_splits': 5},
+            runtime = {'random_state': 'seed'},
+            selected = True,
+            fit_method = None,
+            transform_method = 'split'),
+        'kfold': AnalystTechnique(
+            name = 'kfold',
+            module = 'sklearn.model_selection',
+            algorithm = 'KFold',
+            default = {'n_splits': 5, 'shuffle': False},
+            runtime = {'random_state': 'seed'},
+            selected = True,
+            required = {'shuffle': True},
+            fit_method = None,
+            transform_method = 'split'),
+        'stratified': AnalystTechnique(
+            name = 'stratified',
+            module = 'sklearn.model_selection',
+            algorithm = 'StratifiedKFold',
+            default = {'n_splits': 5, 'shuffle': False},
+            runtime = {'random_state': 'seed'},
+            selected = True,
+            required = {'shuffle': True},
+            fit_method = None,
+            transform_method = 'split'),
+        'time': AnalystTechnique(
+            name = 'time',
+            module = 'sklearn.model_selection',
+            algorithm = 'TimeSeriesSplit',
+            default = {'n_splits': 5},
+            runtime = {'random_state': 'seed'},
+            selected = True,
+            fit_method = None,
+            transform_method = 'split'),
+        'train_test': AnalystTechnique(
+            name = 'train_test',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'TrainTestSplit',
+            default = {'test_size': 0.33},
+            runtime = {'random_state': 'seed'},
+            selected = True,
+            fit_method = None,
+            transform_method = 'split')},
+    'encode': {
+        'backward': AnalystTechnique(
+            name = 'backward',
+            module = 'category_encoders',
+            algorithm = 'BackwardDifferenceEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'basen': AnalystTechnique(
+            name = 'basen',
+            module = 'category_encoders',
+            algorithm = 'BaseNEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'binary': AnalystTechnique(
+            name = 'binary',
+            module = 'category_encoders',
+            algorithm = 'BinaryEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'dummy': AnalystTechnique(
+            name = 'dummy',
+            module = 'category_encoders',
+            algorithm = 'OneHotEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'hashing': AnalystTechnique(
+            name = 'hashing',
+            module = 'category_encoders',
+            algorithm = 'HashingEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'helmert': AnalystTechnique(
+            name = 'helmert',
+            module = 'category_encoders',
+            algorithm = 'HelmertEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'james_stein': AnalystTechnique(
+            name = 'james_stein',
+            module = 'category_encoders',
+            algorithm = 'JamesSteinEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'loo': AnalystTechnique(
+            name = 'loo',
+            module = 'category_encoders',
+            algorithm = 'LeaveOneOutEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'm_estimate': AnalystTechnique(
+            name = 'm_estimate',
+            module = 'category_encoders',
+            algorithm = 'MEstimateEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'ordinal': AnalystTechnique(
+            name = 'ordinal',
+            module = 'category_encoders',
+            algorithm = 'OrdinalEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'polynomial': AnalystTechnique(
+            name = 'polynomial_encoder',
+            module = 'category_encoders',
+            algorithm = 'PolynomialEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'sum': AnalystTechnique(
+            name = 'sum',
+            module = 'category_encoders',
+            algorithm = 'SumEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'target': AnalystTechnique(
+            name = 'target',
+            module = 'category_encoders',
+            algorithm = 'TargetEncoder',
+            data_dependent = {'cols': 'categoricals'}),
+        'woe': AnalystTechnique(
+            name = 'weight_of_evidence',
+            module = 'category_encoders',
+            algorithm = 'WOEEncoder',
+            data_dependent = {'cols': 'categoricals'})},
+    'mix': {
+        'polynomial': AnalystTechnique(
+            name = 'polynomial_mixer',
+            module = 'sklearn.preprocessing',
+            algorithm = 'PolynomialFeatures',
+            default = {
+                'degree': 2,
+                'interaction_only': True,
+                'include_bias': True}),
+        'quotient': AnalystTechnique(
+            name = 'quotient',
+            module = None,
+            algorithm = 'QuotientFeatures'),
+        'sum': AnalystTechnique(
+            name = 'sum',
+            module = None,
+            algorithm = 'SumFeatures'),
+        'difference': AnalystTechnique(
+            name = 'difference',
+            module = None,
+            algorithm = 'DifferenceFeatures')},
+    'cleave': {
+        'cleaver': AnalystTechnique(
+            name = 'cleaver',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'Cleaver')},
+    # 'n_jobs' from the idea is added to each sampler, or to a
+    # 'NearestNeighbors' replacing its required neighbor count, once the
+    # chapters are finalized.
+    'sample': {
+        'adasyn': AnalystTechnique(
+            name = 'adasyn',
+            module = 'imblearn.over_sampling',
+            algorithm = 'ADASYN',
+            default = {'sampling_strategy': 'auto'},
+            required = {'n_neighbors': 5},
+            runtime = {'random_state': 'seed'},
+            fit_method = None,
+            transform_method = 'fit_resample'),
+        'cluster': AnalystTechnique(
+            name = 'cluster',
+            module = 'imblearn.under_sampling',
+            algorithm = 'ClusterCentroids',
+            default = {'sampling_strategy': 'auto'},
+            runtime = {'random_state': 'seed'},
+            fit_method = None,
+            transform_method = 'fit_resample'),
+        'knn': AnalystTechnique(
+            name = 'knn',
+            module = 'imblearn.under_sampling',
+            algorithm = 'AllKNN',
+            default = {'sampling_strategy': 'auto'},
+            fit_method = None,
+            transform_method = 'fit_resample'),
+        'near_miss': AnalystTechnique(
+            name = 'near_miss',
+            module = 'imblearn.under_sampling',
+            algorithm = 'NearMiss',
+            default = {'sampling_strategy': 'auto'},
+            fit_method = None,
+            transform_method = 'fit_resample'),
+        'random_over': AnalystTechnique(
+            name = 'random_over',
+            module = 'imblearn.over_sampling',
+            algorithm = 'RandomOverSampler',
+            default = {'sampling_strategy': 'auto'},
+            runtime = {'random_state': 'seed'},
+            fit_method = None,
+            transform_method = 'fit_resample'),
+        'random_under': AnalystTechnique(
+            name = 'random_under',
+            module = 'imblearn.under_sampling',
+            algorithm = 'RandomUnderSampler',
+            default = {'sampling_strategy': 'auto'},
+            runtime = {'random_state': 'seed'},
+            fit_method = None,
+            transform_method = 'fit_resample'),
+        'smote': AnalystTechnique(
+            name = 'smote',
+            module = 'imblearn.over_sampling',
+            algorithm = 'SMOTE',
+            default = {'sampling_strategy': 'auto'},
+            required = {'k_neighbors': 5},
+            runtime = {'random_state': 'seed'},
+            fit_method = None,
+            transform_method = 'fit_resample',
+            sparse = True),
+        'smotenc': AnalystTechnique(
+            name = 'smotenc',
+            module = 'imblearn.over_sampling',
+            algorithm = 'SMOTENC',
+            default = {'sampling_strategy': 'auto'},
+            required = {'k_neighbors': 5},
+            runtime = {'random_state': 'seed'},
+            data_dependent = {
+                'categorical_features': 'categoricals_indices'},
+            fit_method = None,
+            transform_method = 'fit_resample',
+            sparse = True),
+        'smoteenn': AnalystTechnique(
+            name = 'smoteenn',
+            module = 'imblearn.combine',
+            algorithm = 'SMOTEENN',
+            default = {'sampling_strategy': 'auto'},
+            runtime = {'random_state': 'seed'},
+            fit_method = None,
+            transform_method = 'fit_resample'),
+        'smotetomek': AnalystTechnique(
+            name = 'smotetomek',
+            module = 'imblearn.combine',
+            algorithm = 'SMOTETomek',
+            default = {'sampling_strategy': 'auto'},
+            runtime = {'random_state': 'seed'},
+            fit_method = None,
+            transform_method = 'fit_resample')},
+    'reduce': _REDUCE_OPTIONS,
+    # Searches fit candidates on every core, dispatching at most two
+    # fits per worker at once to cap memory, and skip train scores.
+    'search': {
+        'bayes': AnalystTechnique(
+            name = 'bayes',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'BayesSearch',
+            default = {
+                'n_iter': 20,
+                'n_candidates': 100,
+                'n_jobs': -1},
+            runtime = {'random_state': 'seed'}),
+        'bayes_gpu': AnalystTechnique(
+            name = 'bayes_gpu',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'BayesSearchGPU',
+            default = {'n_iter': 20, 'n_candidates': 512},
+            runtime = {'random_state': 'seed'}),
+        'gridded_random': AnalystTechnique(
+            name = 'gridded_random',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'GriddedRandomSearchCV',
+            default = {
+                'n_iter': 20,
+                'branching': 3,
+                'n_jobs': -1,
+                'pre_dispatch': '2*n_jobs',
+                'return_train_score': False},
+            runtime = {'random_state': 'seed'}),
+        'halving_random': AnalystTechnique(
+            name = 'halving_random',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'HalvingRandomSearchCV',
+            default = {
+                'factor': 3,
+                'scoring': None,
+                'cv': 5,
+                'refit': True,
+                'n_jobs': -1},
+            runtime = {'random_state': 'seed'},
+            selected = True),
+        'random': AnalystTechnique(
+            name = 'random',
+            module = 'sklearn.model_selection',
+            algorithm = 'RandomizedSearchCV',
+            default = {
+                'n_iter': 20,
+                'n_jobs': -1,
+                'pre_dispatch': '2*n_jobs',
+                'return_train_score': False},
+            runtime = {'random_state': 'seed'}),
+        'sobol': AnalystTechnique(
+            name = 'sobol',
+            module = 'simplify.analyst.algorithms',
+            algorithm = 'SobolSearchCV',
+            default = {
+                'n_iter': 20,
+                'n_jobs': -1,
+                'pre_dispatch': '2*n_jobs',
+                'return_train_score': False},
+            runtime = {'random_state': 'seed'})}})
+
+
 @dataclass
 class Tools(Repository):
     """A dictonary of AnalystTechnique options for the Analyst subpackage.
@@ -400,605 +2131,18 @@ class Tools(Repository):
     idea: ClassVar['Idea']
 
     def create(self) -> None:
+        # Copies the shared options of every step other than 'model'.
         self.contents = {
-            'fill': {
-                'defaults': AnalystTechnique(
-                    name = 'defaults',
-                    module = 'simplify.analyst.algorithms',
-                    algorithm = 'smart_fill',
-                    default = {'defaults': {
-                        'boolean': False,
-                        'float': 0.0,
-                        'integer': 0,
-                        'string': '',
-                        'categorical': '',
-                        'list': [],
-                        'datetime': 1/1/1900,
-                        'timedelta': 0}}),
-                'impute': AnalystTechnique(
-                    name = 'defaults',
-                    module = 'sklearn.impute',
-                    algorithm = 'SimpleImputer',
-                    default = {'defaults': {}}),
-                'knn_impute': AnalystTechnique(
-                    name = 'defaults',
-                    module = 'sklearn.impute',
-                    algorithm = 'KNNImputer',
-                    default = {'defaults': {}})},
-            'categorize': {
-                'automatic': AnalystTechnique(
-                    name = 'automatic',
-                    module = 'simplify.analyst.algorithms',
-                    algorithm = 'auto_categorize',
-                    default = {'threshold': 10}),
-                'binary': AnalystTechnique(
-                    name = 'binary',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'Binarizer',
-                    default = {'threshold': 0.5}),
-                'bins': AnalystTechnique(
-                    name = 'bins',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'KBinsDiscretizer',
-                    default = {
-                        'strategy': 'uniform',
-                        'n_bins': 5},
-                    selected = True,
-                    required = {'encode': 'onehot'})},
-            'scale': {
-                'gauss': AnalystTechnique(
-                    name = 'gauss',
-                    module = None,
-                    algorithm = 'Gaussify',
-                    default = {'standardize': False, 'copy': False},
-                    selected = True,
-                    required = {'rescaler': 'standard'}),
-                'maxabs': AnalystTechnique(
-                    name = 'maxabs',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'MaxAbsScaler',
-                    default = {'copy': False},
-                    selected = True),
-                'minmax': AnalystTechnique(
-                    name = 'minmax',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'MinMaxScaler',
-                    default = {'copy': False},
-                    selected = True),
-                'normalize': AnalystTechnique(
-                    name = 'normalize',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'Normalizer',
-                    default = {'copy': False},
-                    selected = True),
-                'quantile': AnalystTechnique(
-                    name = 'quantile',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'QuantileTransformer',
-                    default = {'copy': False},
-                    selected = True),
-                'robust': AnalystTechnique(
-                    name = 'robust',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'RobustScaler',
-                    default = {'copy': False},
-                    selected = True),
-                'standard': AnalystTechnique(
-                    name = 'standard',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'StandardScaler',
-                    default = {'copy': False},
-                    selected = True)},
-            'split': {
-                'group_kfold': AnalystTechnique(
-                    name = 'group_kfold',
-                    module = 'sklearn.model_selection',
-                    algorithm = 'GroupKFold',
-                    default = {'n_splits': 5},
-                    runtime = {'random_state': 'seed'},
-                    selected = True,
-                    fit_method = None,
-                    transform_method = 'split'),
-                'kfold': AnalystTechnique(
-                    name = 'kfold',
-                    module = 'sklearn.model_selection',
-                    algorithm = 'KFold',
-                    default = {'n_splits': 5, 'shuffle': False},
-                    runtime = {'random_state': 'seed'},
-                    selected = True,
-                    required = {'shuffle': True},
-                    fit_method = None,
-                    transform_method = 'split'),
-                'stratified': AnalystTechnique(
-                    name = 'stratified',
-                    module = 'sklearn.model_selection',
-                    algorithm = 'StratifiedKFold',
-                    default = {'n_splits': 5, 'shuffle': False},
-                    runtime = {'random_state': 'seed'},
-                    selected = True,
-                    required = {'shuffle': True},
-                    fit_method = None,
-                    transform_method = 'split'),
-                'time': AnalystTechnique(
-                    name = 'time',
-                    module = 'sklearn.model_selection',
-                    algorithm = 'TimeSeriesSplit',
-                    default = {'n_splits': 5},
-                    runtime = {'random_state': 'seed'},
-                    selected = True,
-                    fit_method = None,
-                    transform_method = 'split'),
-                'train_test': AnalystTechnique(
-                    name = 'train_test',
-                    module = 'sklearn.model_selection',
-                    algorithm = 'ShuffleSplit',
-                    default = {'test_size': 0.33},
-                    runtime = {'random_state': 'seed'},
-                    required = {'n_splits': 1},
-                    selected = True,
-                    fit_method = None,
-                    transform_method = 'split')},
-            'encode': {
-                'backward': AnalystTechnique(
-                    name = 'backward',
-                    module = 'category_encoders',
-                    algorithm = 'BackwardDifferenceEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'basen': AnalystTechnique(
-                    name = 'basen',
-                    module = 'category_encoders',
-                    algorithm = 'BaseNEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'binary': AnalystTechnique(
-                    name = 'binary',
-                    module = 'category_encoders',
-                    algorithm = 'BinaryEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'dummy': AnalystTechnique(
-                    name = 'dummy',
-                    module = 'category_encoders',
-                    algorithm = 'OneHotEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'hashing': AnalystTechnique(
-                    name = 'hashing',
-                    module = 'category_encoders',
-                    algorithm = 'HashingEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'helmert': AnalystTechnique(
-                    name = 'helmert',
-                    module = 'category_encoders',
-                    algorithm = 'HelmertEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'james_stein': AnalystTechnique(
-                    name = 'james_stein',
-                    module = 'category_encoders',
-                    algorithm = 'JamesSteinEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'loo': AnalystTechnique(
-                    name = 'loo',
-                    module = 'category_encoders',
-                    algorithm = 'LeaveOneOutEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'm_estimate': AnalystTechnique(
-                    name = 'm_estimate',
-                    module = 'category_encoders',
-                    algorithm = 'MEstimateEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'ordinal': AnalystTechnique(
-                    name = 'ordinal',
-                    module = 'category_encoders',
-                    algorithm = 'OrdinalEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'polynomial': AnalystTechnique(
-                    name = 'polynomial_encoder',
-                    module = 'category_encoders',
-                    algorithm = 'PolynomialEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'sum': AnalystTechnique(
-                    name = 'sum',
-                    module = 'category_encoders',
-                    algorithm = 'SumEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'target': AnalystTechnique(
-                    name = 'target',
-                    module = 'category_encoders',
-                    algorithm = 'TargetEncoder',
-                    data_dependent = {'cols': 'categoricals'}),
-                'woe': AnalystTechnique(
-                    name = 'weight_of_evidence',
-                    module = 'category_encoders',
-                    algorithm = 'WOEEncoder',
-                    data_dependent = {'cols': 'categoricals'})},
-            'mix': {
-                'polynomial': AnalystTechnique(
-                    name = 'polynomial_mixer',
-                    module = 'sklearn.preprocessing',
-                    algorithm = 'PolynomialFeatures',
-                    default = {
-                        'degree': 2,
-                        'interaction_only': True,
-                        'include_bias': True}),
-                'quotient': AnalystTechnique(
-                    name = 'quotient',
-                    module = None,
-                    algorithm = 'QuotientFeatures'),
-                'sum': AnalystTechnique(
-                    name = 'sum',
-                    module = None,
-                    algorithm = 'SumFeatures'),
-                'difference': AnalystTechnique(
-                    name = 'difference',
-                    module = None,
-                    algorithm = 'DifferenceFeatures')},
-            'cleave': {
-                'cleaver': AnalystTechnique(
-                    name = 'cleaver',
-                    module = 'simplify.analyst.algorithms',
-                    algorithm = 'Cleaver')},
-            'sample': {
-                'adasyn': AnalystTechnique(
-                    name = 'adasyn',
-                    module = 'imblearn.over_sampling',
-                    algorithm = 'ADASYN',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'cluster': AnalystTechnique(
-                    name = 'cluster',
-                    module = 'imblearn.under_sampling',
-                    algorithm = 'ClusterCentroids',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'knn': AnalystTechnique(
-                    name = 'knn',
-                    module = 'imblearn.under_sampling',
-                    algorithm = 'AllKNN',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'near_miss': AnalystTechnique(
-                    name = 'near_miss',
-                    module = 'imblearn.under_sampling',
-                    algorithm = 'NearMiss',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'random_over': AnalystTechnique(
-                    name = 'random_over',
-                    module = 'imblearn.over_sampling',
-                    algorithm = 'RandomOverSampler',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'random_under': AnalystTechnique(
-                    name = 'random_under',
-                    module = 'imblearn.under_sampling',
-                    algorithm = 'RandomUnderSampler',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'smote': AnalystTechnique(
-                    name = 'smote',
-                    module = 'imblearn.over_sampling',
-                    algorithm = 'SMOTE',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'smotenc': AnalystTechnique(
-                    name = 'smotenc',
-                    module = 'imblearn.over_sampling',
-                    algorithm = 'SMOTENC',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    data_dependent = {
-                        'categorical_features': 'categoricals_indices'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'smoteenn': AnalystTechnique(
-                    name = 'smoteenn',
-                    module = 'imblearn.combine',
-                    algorithm = 'SMOTEENN',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample'),
-                'smotetomek': AnalystTechnique(
-                    name = 'smotetomek',
-                    module = 'imblearn.combine',
-                    algorithm = 'SMOTETomek',
-                    default = {'sampling_strategy': 'auto'},
-                    runtime = {'random_state': 'seed'},
-                    fit_method = None,
-                    transform_method = 'fit_resample')},
-            'reduce': {
-                'kbest': AnalystTechnique(
-                    name = 'kbest',
-                    module = 'sklearn.feature_selection',
-                    algorithm = 'SelectKBest',
-                    default = {'k': 10, 'score_func': 'f_classif'},
-                    selected = True),
-                'fdr': AnalystTechnique(
-                    name = 'fdr',
-                    module = 'sklearn.feature_selection',
-                    algorithm = 'SelectFdr',
-                    default = {'alpha': 0.05, 'score_func': 'f_classif'},
-                    selected = True),
-                'fpr': AnalystTechnique(
-                    name = 'fpr',
-                    module = 'sklearn.feature_selection',
-                    algorithm = 'SelectFpr',
-                    default = {'alpha': 0.05, 'score_func': 'f_classif'},
-                    selected = True),
-                'custom': AnalystTechnique(
-                    name = 'custom',
-                    module = 'sklearn.feature_selection',
-                    algorithm = 'SelectFromModel',
-                    default = {'threshold': 'mean'},
-                    runtime = {'estimator': 'algorithm'},
-                    selected = True),
-                'rank': AnalystTechnique(
-                    name = 'rank',
-                    module = 'simplify.critic.rank',
-                    algorithm = 'RankSelect',
-                    selected = True),
-                'rfe': AnalystTechnique(
-                    name = 'rfe',
-                    module = 'sklearn.feature_selection',
-                    algorithm = 'RFE',
-                    default = {'n_features_to_select': 10, 'step': 1},
-                    runtime = {'estimator': 'algorithm'},
-                    selected = True),
-                'rfecv': AnalystTechnique(
-                    name = 'rfecv',
-                    module = 'sklearn.feature_selection',
-                    algorithm = 'RFECV',
-                    default = {'n_features_to_select': 10, 'step': 1},
-                    runtime = {'estimator': 'algorithm'},
-                    selected = True)}}
-        model_options = {
-            'classify': {
-                'adaboost': AnalystTechnique(
-                    name = 'adaboost',
-                    module = 'sklearn.ensemble',
-                    algorithm = 'AdaBoostClassifier',
-                    transform_method = None),
-                'baseline_classifier': AnalystTechnique(
-                    name = 'baseline_classifier',
-                    module = 'sklearn.dummy',
-                    algorithm = 'DummyClassifier',
-                    required = {'strategy': 'most_frequent'},
-                    transform_method = None),
-                'logit': AnalystTechnique(
-                    name = 'logit',
-                    module = 'sklearn.linear_model',
-                    algorithm = 'LogisticRegression',
-                    transform_method = None),
-                'random_forest': AnalystTechnique(
-                    name = 'random_forest',
-                    module = 'sklearn.ensemble',
-                    algorithm = 'RandomForestClassifier',
-                    transform_method = None),
-                'svm_linear': AnalystTechnique(
-                    name = 'svm_linear',
-                    module = 'sklearn.svm',
-                    algorithm = 'SVC',
-                    required = {'kernel': 'linear', 'probability': True},
-                    transform_method = None),
-                'svm_poly': AnalystTechnique(
-                    name = 'svm_poly',
-                    module = 'sklearn.svm',
-                    algorithm = 'SVC',
-                    required = {'kernel': 'poly', 'probability': True},
-                    transform_method = None),
-                'svm_rbf': AnalystTechnique(
-                    name = 'svm_rbf',
-                    module = 'sklearn.svm',
-                    algorithm = 'SVC',
-                    required = {'kernel': 'rbf', 'probability': True},
-                    transform_method = None),
-                'svm_sigmoid': AnalystTechnique(
-                    name = 'svm_sigmoid ',
-                    module = 'sklearn.svm',
-                    algorithm = 'SVC',
-                    required = {'kernel': 'sigmoid', 'probability': True},
-                    transform_method = None),
-                'tensorflow': AnalystTechnique(
-                    name = 'tensorflow',
-                    module = 'tensorflow',
-                    algorithm = None,
-                    default = {
-                        'batch_size': 10,
-                        'epochs': 2},
-                    transform_method = None),
-                'xgboost': AnalystTechnique(
-                    name = 'xgboost',
-                    module = 'xgboost',
-                    algorithm = 'XGBClassifier',
-                    # data_dependent = 'scale_pos_weight',
-                    transform_method = None)},
-            'cluster': {
-                'affinity': AnalystTechnique(
-                    name = 'affinity',
-                    module = 'sklearn.cluster',
-                    algorithm = 'AffinityPropagation',
-                    transform_method = None),
-                'agglomerative': AnalystTechnique(
-                    name = 'agglomerative',
-                    module = 'sklearn.cluster',
-                    algorithm = 'AgglomerativeClustering',
-                    transform_method = None),
-                'birch': AnalystTechnique(
-                    name = 'birch',
-                    module = 'sklearn.cluster',
-                    algorithm = 'Birch',
-                    transform_method = None),
-                'dbscan': AnalystTechnique(
-                    name = 'dbscan',
-                    module = 'sklearn.cluster',
-                    algorithm = 'DBSCAN',
-                    transform_method = None),
-                'kmeans': AnalystTechnique(
-                    name = 'kmeans',
-                    module = 'sklearn.cluster',
-                    algorithm = 'KMeans',
-                    transform_method = None),
-                'mean_shift': AnalystTechnique(
-                    name = 'mean_shift',
-                    module = 'sklearn.cluster',
-                    algorithm = 'MeanShift',
-                    transform_method = None),
-                'spectral': AnalystTechnique(
-                    name = 'spectral',
-                    module = 'sklearn.cluster',
-                    algorithm = 'SpectralClustering',
-                    transform_method = None),
-                'svm_linear': AnalystTechnique(
-                    name = 'svm_linear',
-                    module = 'sklearn.cluster',
-                    algorithm = 'OneClassSVM',
-                    transform_method = None),
-                'svm_poly': AnalystTechnique(
-                    name = 'svm_poly',
-                    module = 'sklearn.cluster',
-                    algorithm = 'OneClassSVM',
-                    transform_method = None),
-                'svm_rbf': AnalystTechnique(
-                    name = 'svm_rbf',
-                    module = 'sklearn.cluster',
-                    algorithm = 'OneClassSVM,',
-                    transform_method = None),
-                'svm_sigmoid': AnalystTechnique(
-                    name = 'svm_sigmoid',
-                    module = 'sklearn.cluster',
-                    algorithm = 'OneClassSVM',
-                    transform_method = None)},
-            'regress': {
-                'adaboost': AnalystTechnique(
-                    name = 'adaboost',
-                    module = 'sklearn.ensemble',
-                    algorithm = 'AdaBoostRegressor',
-                    transform_method = None),
-                'baseline_regressor': AnalystTechnique(
-                    name = 'baseline_regressor',
-                    module = 'sklearn.dummy',
-                    algorithm = 'DummyRegressor',
-                    required = {'strategy': 'mean'},
-                    transform_method = None),
-                'bayes_ridge': AnalystTechnique(
-                    name = 'bayes_ridge',
-                    module = 'sklearn.linear_model',
-                    algorithm = 'BayesianRidge',
-                    transform_method = None),
-                'lasso': AnalystTechnique(
-                    name = 'lasso',
-                    module = 'sklearn.linear_model',
-                    algorithm = 'Lasso',
-                    transform_method = None),
-                'lasso_lars': AnalystTechnique(
-                    name = 'lasso_lars',
-                    module = 'sklearn.linear_model',
-                    algorithm = 'LassoLars',
-                    transform_method = None),
-                'ols': AnalystTechnique(
-                    name = 'ols',
-                    module = 'sklearn.linear_model',
-                    algorithm = 'LinearRegression',
-                    transform_method = None),
-                'random_forest': AnalystTechnique(
-                    name = 'random_forest',
-                    module = 'sklearn.ensemble',
-                    algorithm = 'RandomForestRegressor',
-                    transform_method = None),
-                'ridge': AnalystTechnique(
-                    name = 'ridge',
-                    module = 'sklearn.linear_model',
-                    algorithm = 'Ridge',
-                    transform_method = None),
-                'svm_linear': AnalystTechnique(
-                    name = 'svm_linear',
-                    module = 'sklearn.svm',
-                    algorithm = 'SVC',
-                    required = {'kernel': 'linear', 'probability': True},
-                    transform_method = None),
-                'svm_poly': AnalystTechnique(
-                    name = 'svm_poly',
-                    module = 'sklearn.svm',
-                    algorithm = 'SVC',
-                    required = {'kernel': 'poly', 'probability': True},
-                    transform_method = None),
-                'svm_rbf': AnalystTechnique(
-                    name = 'svm_rbf',
-                    module = 'sklearn.svm',
-                    algorithm = 'SVC',
-                    required = {'kernel': 'rbf', 'probability': True},
-                    transform_method = None),
-                'svm_sigmoid': AnalystTechnique(
-                    name = 'svm_sigmoid ',
-                    module = 'sklearn.svm',
-                    algorithm = 'SVC',
-                    required = {'kernel': 'sigmoid', 'probability': True},
-                    transform_method = None),
-                'xgboost': AnalystTechnique(
-                    name = 'xgboost',
-                    module = 'xgboost',
-                    algorithm = 'XGBRegressor',
-                    # data_dependent = 'scale_pos_weight',
-                    transform_method = None)}}
-        gpu_options = {
-            'classify': {
-                'forest_inference': AnalystTechnique(
-                    name = 'forest_inference',
-                    module = 'cuml',
-                    algorithm = 'ForestInference',
-                    transform_method = None),
-                'random_forest': AnalystTechnique(
-                    name = 'random_forest',
-                    module = 'cuml',
-                    algorithm = 'RandomForestClassifier',
-                    transform_method = None),
-                'logit': AnalystTechnique(
-                    name = 'logit',
-                    module = 'cuml',
-                    algorithm = 'LogisticRegression',
-                    transform_method = None)},
-            'cluster': {
-                'dbscan': AnalystTechnique(
-                    name = 'dbscan',
-                    module = 'cuml',
-                    algorithm = 'DBScan',
-                    transform_method = None),
-                'kmeans': AnalystTechnique(
-                    name = 'kmeans',
-                    module = 'cuml',
-                    algorithm = 'KMeans',
-                    transform_method = None)},
-            'regressor': {
-                'lasso': AnalystTechnique(
-                    name = 'lasso',
-                    module = 'cuml',
-                    algorithm = 'Lasso',
-                    transform_method = None),
-                'ols': AnalystTechnique(
-                    name = 'ols',
-                    module = 'cuml',
-                    algorithm = 'LinearRegression',
-                    transform_method = None),
-                'ridge': AnalystTechnique(
-                    name = 'ridge',
-                    module = 'cuml',
-                    algorithm = 'RidgeRegression',
-                    transform_method = None)}}
-        self.contents['model'] = model_options[
-            self.idea['analyst']['model_type']]
+            step: deepcopy(dict(options))
+            for step, options in _STEP_OPTIONS.items()}
+        # Copies only the model options for the selected 'model_type' so that
+        # published techniques do not alter the shared module-level options.
+        model_type = self.idea['analyst']['model_type']
+        self.contents['model'] = deepcopy(dict(_MODEL_OPTIONS[model_type]))
         if self.idea['general']['gpu']:
-            self.contents['model'].update(
-                gpu_options[idea['analyst']['model_type']])
+            # cuml models are only offered where cuml is installed, so
+            # CPU-only workers never try to import it.
+            if find_spec('cuml') is not None:
+                self.contents['model'].update(
+                    deepcopy(dict(_GPU_MODEL_OPTIONS.get(model_type, {}))))
         return self.contents
\ No newline at end of file
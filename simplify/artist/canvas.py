@@ -98,7 +98,7 @@ class Canvas(Book):
                 'contributors',
                 'plans',
                 'chapters'):
-            getattr(self, '_'.join(['_draft', method]))()
+            getattr(self, f'_draft_{method}')()
         return self
 
 
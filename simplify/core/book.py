@@ -11,10 +11,10 @@ from collections.abc import Container
 from collections.abc import MutableSequence
 from dataclasses import dataclass
 from dataclasses import field
-from importlib import import_module
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
 
+from simplify.core.utilities import import_component
 from simplify.core.utilities import listify
 
 
@@ -298,13 +298,11 @@ class Technique(Container):
 
         """
         try:
-            return getattr(
-                import_module(self.module),
-                getattr(self, component))
+            return import_component(self.module, getattr(self, component))
         except (ImportError, AttributeError):
             try:
-                return getattr(
-                    import_module(self.default_module),
+                return import_component(
+                    self.default_module,
                     getattr(self, component))
             except (ImportError, AttributeError):
                 raise ImportError(' '.join(
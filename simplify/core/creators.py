@@ -8,9 +8,12 @@
 
 from abc import ABC
 from abc import abstractmethod
+from copy import deepcopy
 from dataclasses import dataclass
 from dataclasses import field
+from functools import lru_cache
 from itertools import product
+import sys
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
 
@@ -21,6 +24,32 @@ from simplify.core.repository import Repository
 from simplify.core.utilities import listify
 
 
+@lru_cache(maxsize = 512, typed = True)
+def _distribution(
+        low: Union[int, float],
+        high: Union[int, float]) -> 'rv_frozen':
+    """Returns a frozen scipy.stats distribution spanning 'low' to 'high'.
+
+    Frozen distributions are cached because the same bounds are published for
+    every chapter using a technique. scipy.stats is only imported once a
+    search space is published.
+
+    Args:
+        low (Union[int, float]): lower bound of the distribution.
+        high (Union[int, float]): upper bound of the distribution.
+
+    Returns:
+        'rv_frozen': uniform distribution if either bound is a float and a
+            randint distribution otherwise.
+
+    """
+    from scipy.stats import randint, uniform
+    if isinstance(low, float) or isinstance(high, float):
+        return uniform(low, high - low)
+    else:
+        return randint(low, high)
+
+
 @dataclass
 class Creator(ABC):
 
@@ -103,17 +132,21 @@ class Author(Creator):
             'Project': with 'Book' instance modified.
 
         """
-        # Creates list of steps from 'project'.
-        steps = list(project.overview[self.worker.name].keys())
+        # Creates list of steps from 'project'. Names are interned once so that
+        # the options lookups made for every chapter match keys by identity.
+        steps = [sys.intern(step) for step in
+            project.overview[self.worker.name].keys()]
         # Creates 'possible' list of lists of 'techniques'.
-        possible = list(project.overview[self.worker.name].values())
-        # Creates a list of lists of the Cartesian product of 'possible'.
-        combinations = list(map(list, product(*possible)))
-        # Creates Chapter instance for every combination of techniques.
-        for techniques in combinations:
-            steps = zip(steps, techniques)
-            chapter = self.worker.load('chapter')(steps = steps)
-            project[self.worker.name].chapters.append(chapter)
+        possible = [
+            [sys.intern(technique) if isinstance(technique, str) else technique
+                for technique in techniques]
+            for techniques in project.overview[self.worker.name].values()]
+        # Creates Chapter instance for every combination of techniques, drawing
+        # each combination lazily from the Cartesian product of 'possible'.
+        chapter_class = self.worker.load('chapter')
+        project[self.worker.name].chapters.extend(
+            chapter_class(steps = list(zip(steps, techniques)))
+            for techniques in product(*possible))
         return project
 
     def _draft_serial(self, project: 'Project') -> 'Project':
@@ -145,10 +178,10 @@ class Author(Creator):
             'Project': with 'Book' instance modified.
 
         """
-        new_chapters = []
-        for chapter in project[self.worker.name].chapters:
-            new_chapters.append(self._publish_techniques(instance = chapter))
-        project[self.worker.name].chapters = new_chapters
+        # Finished chapters replace drafts in place in the already sized list.
+        chapters = project[self.worker.name].chapters
+        for i, chapter in enumerate(chapters):
+            chapters[i] = self._publish_techniques(instance = chapter)
         return project
 
     def _publish_serial(self, project: 'Project') -> 'Project':
@@ -224,24 +257,44 @@ class Expert(Creator):
     worker: 'Worker'
     idea: ClassVar['Idea'] = None
 
+    def __post_init__(self) -> None:
+        # Binds the methods which add each type of parameter once, in the
+        # order they are applied to every published 'Technique'.
+        self.parameter_publishers = (
+            self._publish_idea,
+            self._publish_selected,
+            self._publish_search,
+            self._publish_required,
+            self._publish_runtime)
+        return self
+
     """ Private Methods """
 
     def _publish_technique(self,
             technique: 'Technique',
             step: Tuple[str, str]) -> 'Technique':
-        """Finalizes 'technique'.
+        """Finalizes a copy of 'technique'.
+
+        Shared options are finished the first time they are published, so
+        later chapters reuse the finished option without parsing its
+        parameters. Each chapter gets its own copy because applying a
+        technique (fitting, searching, selecting features) changes it.
 
         Args:
             technique ('Technique'): an instance for parameters to be added to.
 
         Returns:
-            'Technique': instance with parameters added.
+            'Technique': copy of 'technique' with parameters added.
 
         """
-        technique.step = step[0]
-        if technique.module and technique.algorithm:
-            technique.algorithm = technique.load('algorithm')
-        return self._publish_parameters(technique = technique)
+        if technique.step is None:
+            technique.step = step[0]
+            # Binds the loaded class to the shared option, so later chapters
+            # reuse it instead of loading it again.
+            if technique.module and isinstance(technique.algorithm, str):
+                technique.algorithm = technique.load('algorithm')
+            technique = self._publish_parameters(technique = technique)
+        return deepcopy(technique)
 
     def _publish_parameters(self, technique: 'Technique') -> 'Technique':
         """Finalizes 'parameters' for 'technique'.
@@ -253,12 +306,9 @@ class Expert(Creator):
             'Technique': instance with parameters added.
 
         """
-        parameter_types = ['idea', 'selected', 'required', 'runtime']
-        # Iterates through types of 'parameter_types'.
-        for parameter_type in parameter_types:
+        for publisher in self.parameter_publishers:
             try:
-                technique = getattr(self, '_'.join(
-                    ['_publish', parameter_type]))(technique = technique)
+                technique = publisher(technique = technique)
             except TypeError:
                 pass
         return technique
@@ -275,11 +325,11 @@ class Expert(Creator):
         """
         try:
             technique.parameters.update(
-                self.idea['_'.join([technique.name, 'parameters'])])
+                self.idea[f'{technique.name}_parameters'])
         except KeyError:
             try:
                 technique.parameters.update(
-                    self.idea['_'.join([technique.step, 'parameters'])])
+                    self.idea[f'{technique.step}_parameters'])
             except AttributeError:
                 pass
         return technique
@@ -338,19 +388,19 @@ class Expert(Creator):
             'Technique': instance with parameters added.
 
         """
-        technique.parameter_space = {}
-        new_parameters = {}
+        if not hasattr(technique, 'parameter_space'):
+            return technique
+        # Partitions 'parameters' in a single pass.
+        parameters = {}
+        parameter_space = {}
         for parameter, values in technique.parameters.items():
-            if isinstance(values, list):
-                if any(isinstance(i, float) for i in values):
-                    technique.parameter_space.update(
-                        {parameter: uniform(values[0], values[1])})
-                elif any(isinstance(i, int) for i in values):
-                    technique.parameter_space.update(
-                        {parameter: randint(values[0], values[1])})
-            else:
-                new_parameters.update({parameter: values})
-        technique.parameters = new_parameters
+            if not isinstance(values, list):
+                parameters[parameter] = values
+            elif (isinstance(values[0], (int, float))
+                    and not isinstance(values[0], bool)):
+                parameter_space[parameter] = _distribution(values[0], values[1])
+        technique.parameters = parameters
+        technique.parameter_space = parameter_space
         return technique
 
     def _publish_runtime(self, technique: 'Technique') -> 'Technique':
@@ -53,6 +53,9 @@ class Dataset(object):
         self.types = DataTypes()
         self._initialize_datatypes()
         self.stages = DataStages(parent = self)
+        # Identifies 'x' and 'y' and the techniques applied to them, if set by
+        # an 'Analyst' sharing a cache.
+        self.digest = None
         return self
 
     """ Factory and Validation Class Methods """
@@ -160,7 +163,11 @@ class Dataset(object):
 
     def __getattr__(self,
             attribute: str) -> Union['DataBunch', pd.DataFrame, pd.Series]:
-        if attribute in ['train', 'training']:
+        # Lets pickle and copy find that dunder methods, such as
+        # '__setstate__', are not defined while '__dict__' is still empty.
+        if attribute.startswith('__') and attribute.endswith('__'):
+            raise AttributeError(attribute)
+        elif attribute in ['train', 'training']:
             return self.__dict__[self.__dict__['train_set']]
         elif attribute in ['test', 'testing']:
             return self.__dict__[self.__dict__['test_set']]
@@ -180,6 +187,10 @@ class Dataset(object):
             return self.__dict__['val_bunch'].x
         elif attribute in ['y_val']:
             return self.__dict__['val_bunch'].y
+        # Returns column indices for a group of columns, such as
+        # 'categoricals_indices'.
+        elif attribute.endswith('_indices'):
+            return self._get_group_indices(group = attribute[:-len('_indices')])
         # Returns appropriate lists of columns with datatype 'attribute'.
         else:
             try:
@@ -189,11 +200,12 @@ class Dataset(object):
                 elif attribute in ['numerics']:
                     return self.floats + self.integers
             except KeyError:
-                try:
-                    return getattr(self.__dict__['data'], attribute)
-                except (AttributeError, KeyError):
-                    raise KeyError(' '.join(
-                        [attribute, 'is not in', self.__class__.__name__]))
+                pass
+            try:
+                return getattr(self.__dict__['data'], attribute)
+            except (AttributeError, KeyError):
+                raise AttributeError(' '.join(
+                    [attribute, 'is not in', self.__class__.__name__]))
 
     def __setattr__(self,
             attribute: str,
@@ -322,19 +334,56 @@ class Dataset(object):
         return [
             key for key, value in self.datatypes.items() if value == datatype]
 
-    def _get_indices(self, columns: Union[List[str], str]) -> List[bool]:
+    def _get_indices(self, columns: Union[List[str], str]) -> List[int]:
         """Gets column indices for a list of column names.
 
+        All of 'columns' are looked up in a single 'get_indexer' call on the
+        column index rather than one 'get_loc' call per column.
+
         Args:
             columns (Union[List[str], str]): name(s) of columns for which
                 indices are sought.
 
         Returns:
-            bool mask for columns matching 'columns'.
+            List[int]: indices of the columns matching 'columns'.
+
+        Raises:
+            KeyError: if any of 'columns' is not in 'data'.
 
         """
-        return [
-            self.data.columns.get_loc(column) for column in listify(columns)]
+        columns = listify(columns)
+        indices = self.data.columns.get_indexer(columns)
+        if (indices < 0).any():
+            raise KeyError(
+                [column for column, index in zip(columns, indices)
+                 if index < 0])
+        return indices.tolist()
+
+    def _get_group_indices(self, group: str) -> List[int]:
+        """Gets column indices for a group of columns, such as 'categoricals'.
+
+        Indices are stored with the column index and group they were computed
+        from, so repeated lookups for unchanged 'data' skip 'get_loc'.
+
+        Args:
+            group (str): name of an attribute which returns column names.
+
+        Returns:
+            List[int]: indices of the columns in 'group'.
+
+        """
+        columns = self.data.columns
+        names = tuple(listify(getattr(self, group)))
+        cache = self.__dict__.setdefault('indices_cache', {})
+        try:
+            cached_columns, cached_names, indices = cache[group]
+            if cached_columns is columns and cached_names == names:
+                return indices
+        except KeyError:
+            pass
+        indices = self._get_indices(columns = list(names))
+        cache[group] = (columns, names, indices)
+        return indices
 
     def _initialize_datatypes(self) -> None:
         """Initializes datatypes for stored pandas data object."""
@@ -415,6 +464,19 @@ class Dataset(object):
         self.stages.change('full')
         return self
 
+    def memmap_xy(self, folder: Union[str, Path]) -> None:
+        """Creates 'x' and 'y' backed by memory-mapped files in 'folder'.
+
+        All features in 'x' must be numeric because they are stored as float32.
+
+        Args:
+            folder (Union[str, Path]): folder where the files are written.
+
+        """
+        self.create_xy()
+        self.full_bunch.memmap(folder = folder)
+        return self
+
     def downcast(self, columns: Optional[Union[List[str], str]] = None) -> None:
         """Decreases memory usage by downcasting datatypes.
 
@@ -522,6 +584,119 @@ class DataBunch(object):
             self._start_columns = []
         return self
 
+    """ Dunder Methods """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns state for pickling with memory-mapped data left on disk.
+
+        Returns:
+            Dict[str, Any]: instance attributes with memory-mapped 'x' and 'y'
+                replaced by None so that only their file paths are pickled.
+
+        """
+        state = self.__dict__.copy()
+        if self.memmapped:
+            state['x'] = None
+            state['y'] = None
+        state.pop('_mapped', None)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restores state and reopens any memory-mapped 'x' and 'y'.
+
+        Args:
+            state (Dict[str, Any]): instance attributes from '__getstate__'.
+
+        """
+        self.__dict__.update(state)
+        if self.__dict__.get('memmap_layout') and self.x is None:
+            self._open_memmaps()
+        return self
+
+    """ Private Methods """
+
+    def _open_memmaps(self) -> None:
+        """Wraps read-only memory-mapped files in pandas 'x' and 'y'."""
+        layout = self.memmap_layout
+        self.x = pd.DataFrame(
+            np.memmap(layout['x_path'], dtype = layout['x_dtype'], mode = 'r',
+                shape = layout['x_shape']),
+            index = layout['index'],
+            columns = layout['columns'],
+            copy = False)
+        y = np.memmap(layout['y_path'], dtype = layout['y_dtype'], mode = 'r',
+            shape = layout['y_shape'])
+        # Non-numeric labels are stored as codes into their categories.
+        if layout.get('y_categories') is not None:
+            y = layout['y_categories'].array.take(y, allow_fill = True)
+        self.y = pd.Series(
+            y,
+            index = layout['index'],
+            name = layout['label'],
+            copy = False)
+        self._mapped = (self.x, self.y)
+        return self
+
+    """ Public Methods """
+
+    @property
+    def memmapped(self) -> bool:
+        """Returns whether 'x' and 'y' are still the memory-mapped objects."""
+        try:
+            return self.x is self._mapped[0] and self.y is self._mapped[1]
+        except AttributeError:
+            return False
+
+    def memmap(self, folder: Union[str, Path]) -> None:
+        """Backs 'x' and 'y' with read-only memory-mapped files in 'folder'.
+
+        Worker processes which unpickle the instance reopen the same files, so
+        every worker shares one copy of the data through the OS page cache
+        instead of receiving its own pickled copy. Non-numeric labels (e.g.
+        string classes) are stored as integer codes, since a memory-mapped
+        file can only hold fixed-size values, and are mapped back to their
+        categories when the files are reopened.
+
+        Args:
+            folder (Union[str, Path]): folder where the files are written.
+
+        Raises:
+            TypeError: if any column in 'x' is not numeric.
+
+        """
+        non_numeric = [
+            column for column, datatype in self.x.dtypes.items()
+            if not pd.api.types.is_numeric_dtype(datatype)]
+        if non_numeric:
+            raise TypeError(' '.join(
+                ['memory-mapped x must be numeric, but these columns are not:',
+                    ', '.join(map(str, non_numeric))]))
+        layout = {
+            'index': self.x.index,
+            'columns': self.x.columns,
+            'label': self.y.name,
+            'y_categories': None}
+        y = self.y.to_numpy()
+        if y.dtype.hasobject:
+            y, layout['y_categories'] = pd.factorize(self.y)
+        for attribute, values in (
+                ('x', self.x.to_numpy(dtype = np.float32)),
+                ('y', y)):
+            path = Path(folder).joinpath(
+                '_'.join([self.name, attribute, 'memmap.dat']))
+            mapped = np.memmap(path, dtype = values.dtype, mode = 'w+',
+                shape = values.shape)
+            mapped[:] = values
+            mapped.flush()
+            del mapped
+            layout.update({
+                '_'.join([attribute, 'path']): str(path),
+                '_'.join([attribute, 'dtype']): values.dtype,
+                '_'.join([attribute, 'shape']): values.shape})
+        self.memmap_layout = layout
+        self._open_memmaps()
+        return self
+
     @property
     def dropped_columns(self) -> List[str]:
         if self._start_columns:
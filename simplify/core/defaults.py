@@ -15,7 +15,8 @@ GENERAL: {
     'gpu': False}
 
 PROJECT = {
-    'project_workers': ['analyze', 'criticize']}
+    'project_workers': ['analyze', 'criticize'],
+    'export_plots': False}
 
 FILES = {
     'source_format': 'csv',
@@ -41,6 +42,13 @@ CHEF = {
     'label': 'target',
     'calculate_hyperparameters': False,
     'export_all_recipes': True,
+    'cache_fits': True,
+    'cache_limit': '1G',
+    'memoize_steps': ['scale', 'encode', 'sample'],
+    'balance_tolerance': 0.9,
+    'search_subsample': 0.1,
+    'search_finalists': 5,
+    'memmap_data': False,
     'fill_techniques': [None],
     'categorize_techniques': [None],
     'scale_techniques': ['normalize', 'minmax'],
@@ -51,7 +59,7 @@ CHEF = {
     'sample_techniques': ['smote', 'adasyn'],
     'reduce_techniques': [None],
     'model_techniques': ['xgboost'],
-    'search_step': 'random'}
+    'search_method': 'random'}
 
 ACTUARY = {
     'explorer_steps': 'summary',
@@ -115,7 +123,8 @@ SAMPLER_PARAMETERS = {
 
 REDUCER_PARAMETERS = {
     'n_features_to_select': 10,
-    'step': 1,
+    'min_features_to_select': 10,
+    'step': 0.05,
     'score_func': 'f_classif',
     'alpha': 0.05,
     'threshold': 'mean'}
@@ -124,7 +133,8 @@ SEARCH_PARAMETERS = {
     'n_iter': 50,
     'scoring': ['roc_auc', 'f1', 'neg_log_loss'],
     'cv': 5,
-    'refit': True}
+    'refit': True,
+    'n_jobs': -1}
 
 RANDOM_FOREST_PARAMETERS = {
     'n_estimators': [20, 1000],
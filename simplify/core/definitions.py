@@ -10,7 +10,6 @@ from collections.abc import Container
 from collections.abc import MutableMapping
 from dataclasses import dataclass
 from dataclasses import field
-from importlib import import_module
 from pathlib import Path
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
@@ -18,6 +17,7 @@ from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
 import numpy as np
 import pandas as pd
 
+from simplify.core.utilities import import_component
 from simplify.core.utilities import listify
 
 
@@ -69,7 +69,7 @@ class Outline(Container):
             bool: whether the attribute exists and is not None.
 
         """
-        return hasattr(self, attribute) and getattr(self, attribute) is not None
+        return getattr(self, attribute, None) is not None
 
     """ Public Methods """
 
@@ -84,13 +84,11 @@ class Outline(Container):
 
         """
         try:
-            return getattr(
-                import_module(self.module),
-                getattr(self, component))
+            return import_component(self.module, getattr(self, component))
         except (ImportError, AttributeError):
             try:
-                return getattr(
-                    import_module(self.default_module),
+                return import_component(
+                    self.default_module,
                     getattr(self, component))
             except (ImportError, AttributeError):
                 raise ImportError(' '.join(
@@ -137,13 +135,18 @@ class SimpleType(MutableMapping):
     def __setitem__(self, key: str, value: Any) -> None:
         """Stoes arguments in 'types' and 'reversed_types' dictionaries.
 
+        Unhashable values are only stored in 'types'.
+
         Args:
             key (str): name of key to set.
             value (Any): value tto be paired with key.
 
         """
         self.types[key] = value
-        self.reversed_types[value] = key
+        try:
+            self.reversed_types[value] = key
+        except TypeError:
+            pass
         return self
 
     def __delitem__(self, key: str) -> None:
@@ -188,5 +191,5 @@ class SimpleType(MutableMapping):
 
     def _create_reversed(self) -> None:
         """Creates 'reversed_types'."""
-        self.reversed_types = {value: key for key, value in self.types.items()}
+        self.reversed_types = dict(zip(self.types.values(), self.types.keys()))
         return self
\ No newline at end of file
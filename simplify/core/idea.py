@@ -348,11 +348,10 @@ class Idea(MutableMapping):
 
         """
         try:
-            return self.configuration['_'.join([instance.name, 'parameters'])]
+            return self.configuration[f'{instance.name}_parameters']
         except (AttributeError, KeyError):
             try:
-                return self.configuration['_'.join(
-                    [instance.technique, 'parameters'])]
+                return self.configuration[f'{instance.technique}_parameters']
             except (AttributeError, KeyError):
                 return {}
 
@@ -369,8 +368,8 @@ class Idea(MutableMapping):
 
         """
         try:
-            return listify(self.configuration[instance.name]['_'.join(
-                [instance.name, suffix])])
+            return listify(
+                self.configuration[instance.name][f'{instance.name}_{suffix}'])
         except (KeyError, AttributeError):
             return None
 
@@ -468,16 +467,21 @@ class Idea(MutableMapping):
             sections.extend(listify(instance.idea_sections))
         except AttributeError:
             pass
+        # Attributes already holding values in the instance '__dict__' are
+        # skipped with a single dict lookup instead of a call to '_inject'.
+        attributes = getattr(instance, '__dict__', {})
         for section in sections:
             try:
-                for key, value in self.configuration[section].items():
+                settings = self.configuration[section]
+            except KeyError:
+                continue
+            for key, value in settings.items():
+                if overwrite or not attributes.get(key):
                     self._inject(
                         instance = instance,
                         attribute = key,
                         value = value,
                         overwrite = overwrite)
-            except KeyError:
-                pass
         return instance
 
     def inject_parameters(self,
@@ -592,7 +596,7 @@ class Idea(MutableMapping):
         if inject_specials:
             for special in ['parameters', 'steps', 'techniques', 'workers']:
                 if hasattr(instance, special):
-                    getattr(self, '_'.join(['inject', special]))(
+                    getattr(self, f'inject_{special}')(
                         instance = instance,
                         overwrite = overwrite)
         # Adds 'general' and other appropriate items to 'instance' as attributes
@@ -13,6 +13,7 @@ from dataclasses import dataclass
 from dataclasses import field
 import datetime
 from pathlib import Path
+import pickle
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
 
@@ -273,8 +274,8 @@ class Inventory(MutableMapping):
                 name = 'pickle',
                 module = None,
                 extension = '.pickle',
-                import_method = '_pickle_object',
-                export_method = '_unpickle_object')}
+                import_method = '_unpickle_object',
+                export_method = '_pickle_object')}
         self.import_format_states = {
             'acquire': 'source_format',
             'parse': 'source_format',
@@ -512,7 +513,7 @@ class Inventory(MutableMapping):
 
         """
         if name is None:
-            name = '_'.join('project', datetime_string())
+            name = f'project_{datetime_string()}'
         self.folders['project'] = self.folders['results'].joinpath(name)
         self._write_folder(folder = self.folders['project'])
         return self
@@ -697,6 +698,22 @@ class Importer(SimpleDistributor):
     file_format_states: Optional[Dict[str, str]] = field(default_factory = dict)
     file_names: Optional[Dict[str, str]] = field(default_factory = dict)
 
+    """ Private Methods """
+
+    def _unpickle_object(self, file_path: Union[str, Path], **kwargs) -> Any:
+        """Loads a pickled object from 'file_path'.
+
+        Args:
+            file_path (Union[str, Path]): a complete file path.
+            kwargs: additional parameters which are ignored.
+
+        Returns:
+            Any: unpickled object.
+
+        """
+        with open(file_path, 'rb') as pickle_file:
+            return pickle.load(pickle_file)
+
     """ Public Methods """
 
     def load(self, **kwargs):
@@ -859,35 +876,83 @@ class Exporter(SimpleDistributor):
             data.replace({True: 1, False: 0}, inplace = True)
         return data
 
+    def _pickle_object(self,
+            variable: Any,
+            file_path: Union[str, Path],
+            **kwargs) -> None:
+        """Pickles 'variable' to 'file_path'.
+
+        The highest available protocol (5 on python 3.8+) is used, which
+        writes large numpy buffers in fitted estimators without extra copies.
+
+        Args:
+            variable (Any): object to be pickled.
+            file_path (Union[str, Path]): a complete file path.
+            kwargs: additional parameters which are ignored.
+
+        """
+        with open(file_path, 'wb') as pickle_file:
+            pickle.dump(variable, pickle_file, protocol = pickle.HIGHEST_PROTOCOL)
+        return self
+
     """ Public Methods """
 
-    # def initialize_writer(self,
-    #         file_path: str,
-    #         columns: List[str],
-    #         encoding: Optional[str] = None,
-    #         dialect: Optional[str] = 'excel') -> None:
-    #     """Initializes writer object for line-by-line exporting to a .csv file.
+    def initialize_writer(self,
+            file_path: Union[str, Path],
+            columns: List[str],
+            encoding: Optional[str] = None,
+            dialect: Optional[str] = 'excel') -> None:
+        """Opens a .csv file for line-by-line exporting.
 
-    #     Args:
-    #         file_path (str): a complete path to the file being written to.
-    #         columns (List[str]): column names to be added to the first row of
-    #             the file as column headers.
-    #         encoding (str): a python encoding type.
-    #         dialect (str): the specific type of csv file created. Defaults to
-    #             'excel'.
+        Reports which gain a row per chapter can append each row with
+        'iterate_writer' instead of rewriting the whole report every time a
+        row is added.
 
-    #     """
-    #     if not columns:
-    #         error = 'initialize_writer requires columns as a list type'
-    #         raise TypeError(error)
-    #     with open(file_path, mode = 'w', newline = '',
-    #               encoding = self.file_encoding) as self.output_series:
-    #         self.writer = csv.writer(self.output_series, dialect = dialect)
-    #         self.writer.writerow(columns)
-    #     return self
-
-    # def iterate_writer(self):
-    #     return self
+        Args:
+            file_path (Union[str, Path]): a complete path to the file being
+                written to.
+            columns (List[str]): column names to be added to the first row of
+                the file as column headers.
+            encoding (Optional[str]): a python encoding type. Defaults to None.
+                If not passed, 'file_encoding' of 'inventory' is used.
+            dialect (Optional[str]): the specific type of csv file created.
+                Defaults to 'excel'.
+
+        Raises:
+            TypeError: if 'columns' is empty.
+
+        """
+        if not columns:
+            raise TypeError('initialize_writer requires columns as a list type')
+        if encoding is None:
+            encoding = self.inventory.file_encoding
+        self.output_file = open(
+            file_path,
+            mode = 'w',
+            newline = '',
+            encoding = encoding)
+        self.writer = csv.writer(self.output_file, dialect = dialect)
+        self.writer.writerow(columns)
+        return self
+
+    def iterate_writer(self, row: Iterable[Any]) -> None:
+        """Appends 'row' to the file opened by 'initialize_writer'.
+
+        The file is flushed after each row so that a partial report is on disk
+        if a project is interrupted.
+
+        Args:
+            row (Iterable[Any]): values in the same order as 'columns'.
+
+        """
+        self.writer.writerow(row)
+        self.output_file.flush()
+        return self
+
+    def close_writer(self) -> None:
+        """Closes the file opened by 'initialize_writer'."""
+        self.output_file.close()
+        return self
 
     def save(self, **kwargs):
         """Calls 'apply' method with **kwargs."""
@@ -69,6 +69,9 @@ class ProjectManager(object):
         auto_apply (Optional[bool]): whether to call the 'apply' method when
             instanced. For auto_apply to have an effect, 'dataset' must also
             be passed. Defaults to False.
+        export_plots (Optional[bool]): whether the 'artist' 'Book', if there
+            is one, is applied to create plots when the 'apply' method is
+            called. Defaults to False.
         name (Optional[str]): designates the name of the class used for internal
             referencing throughout siMpLify. If the class needs settings from
             the shared Idea instance, 'name' should match the appropriate
@@ -99,6 +102,7 @@ class ProjectManager(object):
     auto_draft: Optional[bool] = True
     auto_publish: Optional[bool] = True
     auto_apply: Optional[bool] = False
+    export_plots: Optional[bool] = False
     name: Optional[str] = field(default_factory = lambda: 'project')
     identification: Optional[str] = field(default_factory = datetime_string)
 
@@ -117,7 +121,7 @@ class ProjectManager(object):
         self.inventory = Inventory.create(root_folder = self.inventory)
         self._inject_instance(
             source = 'inventory',
-            targets = [Dataset, Book])
+            targets = [Dataset, Book, Scholar])
         # Validates 'Dataset' instance.
         self.dataset = Dataset.create(data = self.dataset)
         # Validates 'workers' attribute.
@@ -402,8 +406,11 @@ class ProjectManager(object):
         if data:
             self.dataset = Dataset.create(data = data)
         # Iterates through each worker, creating and applying needed Books,
-        # Chapters, and Techniques for each worker in the Project.
+        # Chapters, and Techniques for each worker in the Project. Plotting is
+        # optional output, so the 'artist' is skipped unless plots are wanted.
         for name, book in self.project.library.items():
+            if name in ['artist'] and not self.export_plots:
+                continue
             self.project, self.dataset = self.workers[name].scholar.apply(
                 worker = name,
                 project = self.project,
@@ -496,9 +503,13 @@ class Project(MutableMapping):
         return self.__str__()
 
     def __str__(self) -> str:
-        print(' '.join(['Project', self.identification, ':']))
-        print(self.overview)
-        return self
+        """Returns the project identification and 'overview' as one string.
+
+        Returns:
+            str: header line followed by the 'overview' of the project.
+
+        """
+        return f'Project {self.identification} :\n{self.overview}'
 
     """ Public Methods """
 
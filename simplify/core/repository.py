@@ -10,12 +10,12 @@ from collections.abc import Container
 from collections.abc import MutableMapping
 from dataclasses import dataclass
 from dataclasses import field
-from importlib import import_module
 from pathlib import Path
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
 
 from simplify.core.utilities import deduplicate
+from simplify.core.utilities import import_component
 from simplify.core.utilities import listify
 from simplify.core.utilities import subsetify
 
@@ -452,7 +452,7 @@ class Outline(Container):
             bool: whether the attribute exists and is not None.
 
         """
-        return hasattr(self, attribute) and getattr(self, attribute) is not None
+        return getattr(self, attribute, None) is not None
 
     """ Public Methods """
 
@@ -467,13 +467,11 @@ class Outline(Container):
 
         """
         try:
-            return getattr(
-                import_module(self.module),
-                getattr(self, component))
+            return import_component(self.module, getattr(self, component))
         except (ImportError, AttributeError):
             try:
-                return getattr(
-                    import_module(self.default_module),
+                return import_component(
+                    self.default_module,
                     getattr(self, component))
             except (ImportError, AttributeError):
                 raise ImportError(' '.join(
@@ -9,22 +9,34 @@
 from collections.abc import MutableMapping
 from dataclasses import dataclass
 from dataclasses import field
+import gc
 import multiprocessing as mp
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
 
+import joblib
 import numpy as np
 import pandas as pd
-try:
-    from pathos.multiprocessing import ProcessPool as Pool
-except ImportError:
-    from multiprocessing import Pool
 
 from simplify.core.repository import Repository
 from simplify.core.utilities import listify
 from simplify.core.validators import DataValidator
 
 
+def _load_pool() -> Callable:
+    """Returns the process pool class, preferring pathos if it is installed.
+
+    pathos (and dill, which it imports) is only loaded when a pool is needed,
+    not whenever a 'Scholar' is imported.
+
+    """
+    try:
+        from pathos.multiprocessing import ProcessPool as Pool
+    except ImportError:
+        from multiprocessing import Pool
+    return Pool
+
+
 @dataclass
 class Scholar(object):
     """Base class for applying 'Book' instances to data.
@@ -33,10 +45,15 @@ class Scholar(object):
         idea ('Idea'): an instance with project settings.
         worker ('Worker'): instance with information needed to create a Book
             instance.
+        inventory ('Inventory'): an instance with file and folder paths.
+        collect_interval (ClassVar[int]): number of chapters applied between
+            full garbage collections. Defaults to 32.
 
     """
     worker: Optional['Worker'] = None
     idea: ClassVar['Idea'] = None
+    inventory: ClassVar['Inventory'] = None
+    collect_interval: ClassVar[int] = 32
 
     def __post_init__(self) -> None:
         """Initializes class instance attributes."""
@@ -44,6 +61,24 @@ class Scholar(object):
         self.parallelizer = Parallelizer(idea = self.idea)
         return self
 
+    """ Dunder Methods """
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Returns state for pickling with the shared 'idea' and 'inventory'.
+
+        Worker processes import this module again, so class attributes set in
+        the parent process are not there. Storing 'idea' and 'inventory' with
+        the instance lets a pickled 'Scholar' apply chapters in a worker.
+
+        Returns:
+            Dict[str, Any]: instance attributes with 'idea' and 'inventory'.
+
+        """
+        state = self.__dict__.copy()
+        state['idea'] = self.idea
+        state['inventory'] = self.inventory
+        return state
+
     """ Private Methods """
 
     def _finalize_chapters(self, book: 'Book', data: 'Dataset') -> 'Book':
@@ -91,14 +126,12 @@ class Scholar(object):
             'technique': instance with any conditional parameters added.
 
         """
-        try:
-            if technique is not None:
-                return getattr(book, '_'.join(
-                    ['_add', technique.name, 'conditionals']))(
-                        technique = technique,
-                        data = data)
-        except AttributeError:
-            return technique
+        if technique is not None:
+            method = getattr(
+                self, f'_add_{technique.step}_conditionals', None)
+            if method is not None:
+                return method(technique = technique, data = data)
+        return technique
 
     def _add_data_dependent(self,
             technique: 'Technique',
@@ -120,7 +153,7 @@ class Scholar(object):
             for key, value in technique.data_dependent.items():
                 try:
                     technique.parameters.update({key: getattr(data, value)})
-                except KeyError:
+                except (AttributeError, KeyError):
                     print('no matching parameter found for', key, 'in data')
         return technique
 
@@ -204,18 +237,28 @@ class Scholar(object):
                 book = project[worker],
                 data = data)
         if self.parallelize:
-            self.parallelizer.apply_chapters(
+            project[worker] = self.parallelizer.apply_chapters(
+                book = project[worker],
                 data = data,
                 method = self._apply_chapter)
         else:
-            new_chapters = []
-            for i, chapter in enumerate(project[worker].chapters):
-                if self.verbose:
-                    print('Applying chapter', str(i + 1), 'to data')
-                new_chapters.append(self._apply_chapter(
-                    chapter = chapter,
-                    data = data))
-            project[worker].chapters = new_chapters
+            # Applied chapters replace drafts in place in the already sized
+            # list. Automatic garbage collection is paused while chapters are
+            # applied and a single full collection is run every
+            # 'collect_interval' chapters instead.
+            chapters = project[worker].chapters
+            gc.disable()
+            try:
+                for i, chapter in enumerate(chapters):
+                    if self.verbose:
+                        print('Applying chapter', str(i + 1), 'to data')
+                    chapters[i] = self._apply_chapter(
+                        chapter = chapter,
+                        data = data)
+                    if (i + 1) % self.collect_interval == 0:
+                        gc.collect()
+            finally:
+                gc.enable()
         return project, data
 
 
@@ -225,9 +268,15 @@ class Parallelizer(object):
 
     Args:
         idea ('Idea'): shared 'Idea' instance with project settings.
+        n_jobs (Optional[int]): number of worker processes used by
+            'apply_chapters'. Defaults to -1, which uses every core.
+        max_nbytes (Optional[str]): size above which arrays passed to workers
+            are memory-mapped by joblib instead of pickled. Defaults to '100M'.
 
     """
     idea: 'Idea'
+    n_jobs: Optional[int] = -1
+    max_nbytes: Optional[str] = '100M'
 
     def __post_init__(self) -> None:
         """Initializes class instance attributes."""
@@ -274,6 +323,7 @@ class Parallelizer(object):
             'Book': with its iterable applied to data.
 
         """
+        Pool = _load_pool()
         with Pool() as pool:
             pool.starmap(method, arguments)
         pool.close()
@@ -285,30 +335,32 @@ class Parallelizer(object):
             book: 'Book',
             data: Union['Dataset', 'Book'],
             method: Callable) -> 'Book':
-        """Applies 'method' to 'data'.
+        """Applies 'method' to 'data' with each chapter in a separate process.
+
+        Chapters are independent, so each is dispatched to a joblib worker.
+        'data' should hold memory-mapped 'x' and 'y' (see 'Dataset.memmap_xy')
+        so that every worker reads them through the OS page cache instead of
+        receiving its own copy. Chapters are returned in their original order
+        for any serial work, such as evaluation, which follows.
 
         Args:
             book ('Book'): siMpLify class instance with Chapter instances to
                 parallelize.
             data (Union['Dataset', 'Book']): an instance containing data to
                 be modified.
-            method (Callable): method to parallelize.
+            method (Callable): method to parallelize. It is called with
+                'chapter' and 'data' keyword arguments and returns a 'Chapter'.
 
         Returns:
             'Book': with its iterable applied to data.
 
         """
-        arguments = []
-        for key, chapter in book.chapters.items():
-            arguments.append((chapter, data))
-        results = []
-        chapters_keys = list(book.chapters.keys())
-        with Pool() as pool:
-            results.append[pool.map(method, arguments)]
-        pool.close()
-        pool.join()
-        pool.clear()
-        book.chapters = dict(zip(chapters_keys, results))
+        book.chapters = joblib.Parallel(
+            n_jobs = self.n_jobs,
+            prefer = 'processes',
+            max_nbytes = self.max_nbytes)(
+                joblib.delayed(method)(chapter = chapter, data = data)
+                for chapter in book.chapters)
         return book
 
     def apply_data(self,
@@ -325,7 +377,7 @@ class Parallelizer(object):
 
         """
         dfs = np.array_split(data.data, mp.cpu_count(), axis = 0)
-        pool = Pool()
+        pool = _load_pool()()
         data.data = np.vstack(pool.map(method, dfs))
         pool.close()
         pool.join()
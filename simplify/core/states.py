@@ -15,8 +15,6 @@ from dataclasses import field
 from functools import update_wrapper
 from functools import wraps
 from importlib import import_module
-from inspect import signature
-from multiprocessing import Pool
 from pathlib import Path
 from typing import (Any, Callable, ClassVar, Dict, Iterable, List, Optional,
     Tuple, Union)
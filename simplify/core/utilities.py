@@ -8,6 +8,7 @@
 
 from datetime import datetime
 from functools import wraps
+from importlib import import_module
 from inspect import signature
 from pathlib import Path
 import time
@@ -87,6 +88,29 @@ def deduplicate(iterable: Union[List, pd.DataFrame, pd.Series]) -> (
     except TypeError:
         return iterable.drop_duplicates(inplace = True)
 
+_IMPORT_CACHE: Dict[Tuple[str, str], object] = {}
+
+def import_component(module: str, name: str) -> object:
+    """Returns 'name' from 'module', importing 'module' on first use.
+
+    Resolved objects are stored in '_IMPORT_CACHE' keyed by module and name,
+    so later loads of the same component are a single dict lookup.
+
+    Args:
+        module (str): name of module to import.
+        name (str): name of object to load from 'module'.
+
+    Returns:
+        object: from 'module'.
+
+    """
+    key = (module, name)
+    component = _IMPORT_CACHE.get(key)
+    if component is None:
+        component = getattr(import_module(module), name)
+        _IMPORT_CACHE[key] = component
+    return component
+
 def is_nested(dictionary: Dict[Any, Any]) -> bool:
     """Returns if passed 'contents' is nested at least one-level.
 
@@ -329,8 +353,9 @@ def localize_arguments(
 
     """
     def shell_localize_arguments(method: Callable, *args, **kwargs):
+        call_signature = signature(method)
         def wrapper(self, *args, **kwargs):
-            arguments = dict(signature(method).bind(*args, **kwargs).arguments)
+            arguments = dict(call_signature.bind(*args, **kwargs).arguments)
             for argument, value in arguments.items():
                 if argument not in self.__dict__ or override:
                     if ((includes and argument in includes)
@@ -364,9 +389,9 @@ def use_local_backups(
 
     """
     def shell_use_local_backups(method: Callable, *args, **kwargs):
+        call_signature = signature(method)
+        parameters = dict(call_signature.parameters)
         def wrapper(self, *args, **kwargs):
-            call_signature = signature(method)
-            parameters = dict(call_signature.parameters)
             arguments = dict(call_signature.bind(*args, **kwargs).arguments)
             unpassed = list(parameters.keys() - arguments.keys())
             if includes:
@@ -42,6 +42,7 @@ class SimpleValidator(ABC):
 
         """
         self.callable = callable
+        self.signature = signature(self.callable)
         update_wrapper(self, self.callable)
         if self.validators is None:
             self.validators = {}
@@ -56,7 +57,7 @@ class SimpleValidator(ABC):
             Callable: with all arguments converted to appropriate types.
 
         """
-        call_signature = signature(self.callable)
+        call_signature = self.signature
         @wraps(self.callable)
         def wrapper(self, *args, **kwargs):
             arguments = dict(call_signature.bind(*args, **kwargs).arguments)
@@ -152,7 +153,7 @@ def DataValidator(SimpleValidator):
             Callable: with all arguments converted to appropriate types.
 
         """
-        call_signature = signature(self.callable)
+        call_signature = self.signature
         @wraps(self.callable)
         def wrapper(self, *args, **kwargs):
             arguments = dict(call_signature.bind(*args, **kwargs).arguments)
@@ -275,7 +276,7 @@ def ColumnsValidator(SimpleValidator):
             Callable: with all arguments converted to appropriate types.
 
         """
-        call_signature = signature(self.callable)
+        call_signature = self.signature
         @wraps(self.callable)
         def wrapper(self, *args, **kwargs):
             arguments = dict(call_signature.bind(*args, **kwargs).arguments)
@@ -131,13 +131,13 @@ class ShapExplain(Explainer):
     def _apply_chapter(self, chapter: 'Chapter') -> 'Chapter':
         self.method = self.method(model = self.model, data = chapter.data)
         chapter.explanations['shap_values'] = self.method.shap_values(
-            getattr(chapter.data, '_'.join(
-                ['x', self.idea['critic']['data_to_review']])))
+            getattr(chapter.data,
+                f"x_{self.idea['critic']['data_to_review']}"))
         if self.method_types[self.model] in ['tree']:
             chapter.explanations['shap_interactions'] = (
                 self.method.shap_interaction_values(
-                    getattr(chapter.data, '_'.join(
-                        ['x', self.idea['critic']['data_to_review']]))))
+                    getattr(chapter.data,
+                        f"x_{self.idea['critic']['data_to_review']}")))
         return chapter
 
     """ Core siMpLify Methods """
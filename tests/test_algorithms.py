@@ -0,0 +1,203 @@
+"""
+.. module:: test algorithms
+:synopsis: tests custom analyst algorithms
+:author: Corey Rayburn Yung
+:copyright: 2019
+:license: Apache-2.0
+"""
+
+import pickle
+
+import joblib
+import numpy as np
+from scipy.stats import randint, uniform
+from sklearn.datasets import make_classification
+from sklearn.feature_selection import SelectKBest
+from sklearn.preprocessing import RobustScaler
+from sklearn.feature_selection import f_classif
+from sklearn.tree import DecisionTreeClassifier
+
+from simplify.analyst.algorithms import BayesSearch
+from simplify.analyst.algorithms import CachedScorer
+from simplify.analyst.algorithms import ColumnChunks
+from simplify.analyst.algorithms import expected_improvement
+from simplify.analyst.algorithms import Gaussify
+from simplify.analyst.algorithms import GriddedRandomSearchCV
+from simplify.analyst.algorithms import sample_parameters
+from simplify.analyst.algorithms import SobolSearchCV
+from simplify.analyst.algorithms import TrainTestSplit
+
+
+def test_expected_improvement():
+    improvement = expected_improvement(
+        mean = np.array([0.5, 0.9, 0.9]),
+        deviation = np.array([0.1, 0.1, 0.0]),
+        best = 0.8)
+    assert improvement[1] > improvement[0]
+    assert improvement[1] > improvement[2]
+    return
+
+
+def test_sample_parameters():
+    settings = sample_parameters(
+        param_distributions = {
+            'max_depth': randint(1, 10),
+            'min_samples_split': uniform(0.01, 0.5),
+            'criterion': ['gini', 'entropy']},
+        n_iter = 50,
+        random_state = np.random.RandomState(0))
+    assert len(settings) == 50
+    assert all(isinstance(setting['max_depth'], int) for setting in settings)
+    assert all(1 <= setting['max_depth'] < 10 for setting in settings)
+    assert all(0.01 <= setting['min_samples_split'] <= 0.51
+        for setting in settings)
+    assert {setting['criterion'] for setting in settings} == {
+        'gini', 'entropy'}
+    return
+
+
+def test_bayes_search():
+    x, y = make_classification(n_samples = 100, random_state = 0)
+    search = BayesSearch(
+        estimator = DecisionTreeClassifier(random_state = 0),
+        param_distributions = {
+            'max_depth': randint(1, 10),
+            'min_samples_split': uniform(0.01, 0.5)},
+        n_iter = 8,
+        n_initial = 3,
+        n_candidates = 20,
+        cv = 3,
+        random_state = 0)
+    search.fit(x, y)
+    assert len(search.cv_results_['params']) == 8
+    assert search.best_score_ == max(search.cv_results_['mean_test_score'])
+    assert search.best_estimator_.max_depth == search.best_params_['max_depth']
+    return
+
+
+def test_cached_scorer():
+    x, y = make_classification(n_samples = 100, random_state = 0)
+    calls = []
+    def score_func(x, y):
+        calls.append(1)
+        return f_classif(x, y)
+    scorer = CachedScorer(score_func = score_func)
+    first = SelectKBest(score_func = scorer, k = 5).fit(x, y)
+    second = SelectKBest(score_func = scorer, k = 5).fit(x, y)
+    assert len(calls) == 1
+    assert np.array_equal(first.get_support(), second.get_support())
+    SelectKBest(score_func = scorer, k = 5).fit(x.copy(), y)
+    assert len(calls) == 2
+    shared = CachedScorer(
+        score_func = score_func,
+        scores = scorer.scores,
+        digest = 'fold')
+    SelectKBest(score_func = shared, k = 5).fit(x, y)
+    SelectKBest(score_func = shared, k = 5).fit(x.copy(), y)
+    assert len(calls) == 3
+    pickled = CachedScorer(
+        score_func = f_classif,
+        scores = scorer.scores,
+        digest = 'fold')
+    assert not pickle.loads(pickle.dumps(pickled)).scores
+    assert pickle.loads(pickle.dumps(pickled)).digest is None
+    assert joblib.hash(pickled) == joblib.hash(
+        CachedScorer(score_func = f_classif))
+    return
+
+
+def test_gridded_random_search():
+    x, y = make_classification(n_samples = 100, random_state = 0)
+    search = GriddedRandomSearchCV(
+        estimator = DecisionTreeClassifier(random_state = 0),
+        param_distributions = {
+            'max_depth': randint(1, 10),
+            'min_samples_split': uniform(0.01, 0.5)},
+        n_iter = 9,
+        branching = 3,
+        cv = 3,
+        random_state = 0)
+    search.fit(x, y)
+    depths = [params['max_depth'] for params in search.cv_results_['params']]
+    assert len(depths) == 9
+    assert sorted((depth - 1) // 3 for depth in depths) == [0, 0, 0, 1, 1, 1, 2, 2, 2]
+    return
+
+
+def test_sobol_search():
+    x, y = make_classification(n_samples = 100, random_state = 0)
+    search = SobolSearchCV(
+        estimator = DecisionTreeClassifier(random_state = 0),
+        param_distributions = {
+            'max_depth': randint(1, 9),
+            'criterion': ['gini', 'entropy']},
+        n_iter = 8,
+        cv = 3,
+        random_state = 0)
+    search.fit(x, y)
+    depths = [params['max_depth'] for params in search.cv_results_['params']]
+    criteria = [params['criterion'] for params in search.cv_results_['params']]
+    assert sorted(depths) == list(range(1, 9))
+    assert criteria.count('gini') == 4
+    return
+
+
+def test_gaussify():
+    random_state = np.random.RandomState(0)
+    x = np.column_stack([
+        random_state.lognormal(size = 200),
+        random_state.normal(size = 200) - 1,
+        random_state.exponential(size = 200) + 1])
+    original = x.copy()
+    gaussify = Gaussify().fit(x)
+    transformed = gaussify.transform(x)
+    assert list(gaussify.positive_) == [True, False, True]
+    assert np.array_equal(x, original)
+    assert np.allclose(transformed.mean(axis = 0), 0)
+    assert np.allclose(transformed.std(axis = 0), 1)
+    subsampled = Gaussify(subsample = 50, random_state = 0).fit(x)
+    assert subsampled.transform(x).shape == x.shape
+    return
+
+
+def test_column_chunks():
+    x = np.random.RandomState(0).normal(size = (100, 7))
+    chunks = ColumnChunks(estimator = RobustScaler(), n_jobs = 3).fit(x)
+    assert len(chunks.estimators_) == 3
+    assert np.allclose(
+        chunks.transform(x),
+        RobustScaler().fit_transform(x))
+    return
+
+
+def test_train_test_split():
+    x = np.zeros((300, 2))
+    y = np.repeat([0, 1, 2], 100)
+    splits = list(TrainTestSplit(random_state = 0, stratify = True).split(
+        x, y))
+    assert len(splits) == 1
+    train_index, test_index = splits[0]
+    assert len(train_index) + len(test_index) == 300
+    assert np.bincount(y[test_index]).tolist() == [33, 33, 33]
+    train_index, test_index = next(TrainTestSplit(random_state = 0).split(
+        x, y.astype(float)))
+    assert len(test_index) == 99
+    assert not np.intersect1d(train_index, test_index).size
+    counts = np.arange(300) % 150
+    train_index, test_index = next(TrainTestSplit(random_state = 0).split(
+        x, counts))
+    assert len(test_index) == 99
+    assert not np.intersect1d(train_index, test_index).size
+    return
+
+
+if __name__ == '__main__':
+    test_expected_improvement()
+    test_sample_parameters()
+    test_bayes_search()
+    test_cached_scorer()
+    test_gridded_random_search()
+    test_sobol_search()
+    test_gaussify()
+    test_column_chunks()
+    test_train_test_split()
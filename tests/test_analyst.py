@@ -0,0 +1,242 @@
+"""
+.. module:: test analyst
+:synopsis: tests applying analyst chapters to data
+:author: Corey Rayburn Yung
+:copyright: 2019
+:license: Apache-2.0
+"""
+
+from pathlib import Path
+import tempfile
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from sklearn.datasets import make_classification
+
+from simplify.analyst.analyst import Analyst
+from simplify.analyst.analyst import AnalystTechnique
+from simplify.analyst.analyst import Tools
+from simplify.core.book import Book
+from simplify.core.book import Chapter
+from simplify.core.creators import Expert
+from simplify.core.dataset import Dataset
+from simplify.core.idea import Idea
+from simplify.core.project import Worker
+from simplify.core.scholar import Parallelizer
+
+
+def _create_analyst():
+    idea = Idea(configuration = {
+        'general': {
+            'verbose': 'False',
+            'seed': 43,
+            'gpu': 'False',
+            'parallelize': 'False'},
+        'analyst': {
+            'search_method': 'random',
+            'model_type': 'classify',
+            'label': 'target'},
+        'search_parameters': {
+            'n_iter': 3,
+            'cv': 2,
+            'refit': 'True',
+            'scoring': 'accuracy',
+            'n_jobs': 1},
+        'random_forest_parameters': {
+            'n_estimators': '2, 10',
+            'max_depth': '1, 4'}})
+    for shared in [Analyst, Dataset, Expert, Tools]:
+        shared.idea = idea
+    worker = Worker(
+        name = 'analyst',
+        module = 'simplify.analyst.analyst',
+        options = Tools())
+    worker.technique = AnalystTechnique
+    x, y = make_classification(
+        n_samples = 60,
+        n_features = 4,
+        random_state = 0)
+    dataset = pd.DataFrame(x, columns = ['a', 'b', 'c', 'd'])
+    dataset['target'] = y
+    return Analyst(worker = worker), Dataset(data = dataset)
+
+
+def _create_book(analyst, data, steps):
+    expert = Expert(worker = analyst.worker)
+    chapters = []
+    for chapter_steps in steps:
+        chapter = Chapter(steps = chapter_steps)
+        for step in chapter_steps:
+            chapter.techniques.extend(expert.publish(step = step))
+        chapters.append(chapter)
+    return analyst._finalize_chapters(
+        book = Book(chapters = chapters),
+        data = data)
+
+
+def test_chapter_searches():
+    analyst, data = _create_analyst()
+    book = _create_book(
+        analyst = analyst,
+        data = data,
+        steps = [
+            [('scale', 'minmax'), ('model', 'random_forest')],
+            [('scale', 'standard'), ('model', 'random_forest')]])
+    for chapter in book.chapters:
+        analyst._apply_chapter(chapter = chapter, data = data)
+    first, second = [chapter.techniques[-1] for chapter in book.chapters]
+    assert first is not second
+    assert first.algorithm is not second.algorithm
+    for technique in [first, second]:
+        assert not technique.parameter_space
+        assert 'max_depth' in technique.parameters
+        assert hasattr(technique.algorithm, 'estimators_')
+    assert analyst.worker.options['model']['random_forest'].parameter_space
+    return
+
+
+def test_prefix_restore():
+    analyst, data = _create_analyst()
+    book = _create_book(
+        analyst = analyst,
+        data = data,
+        steps = [
+            [('scale', 'minmax'), ('scale', 'standard')],
+            [('scale', 'minmax'), ('scale', 'maxabs')]])
+    first, second = book.chapters
+    data.create_xy()
+    original = data.x.copy()
+    analyst._apply_chapter(chapter = first, data = data)
+    assert len(analyst.prefix_states) == 3
+    assert np.allclose(analyst.prefix_states[0][1], original)
+    shared = analyst.prefix_states[1][1]
+    saved = shared.copy()
+    analyst._apply_chapter(chapter = second, data = data)
+    assert len(analyst.prefix_states) == 3
+    assert analyst.prefix_states[1][1] is shared
+    assert shared.equals(saved)
+    assert analyst.prefix_states[2][0][1] == 'maxabs'
+    assert np.allclose(data.x, saved / saved.abs().max())
+    return
+
+
+def test_prefix_protect():
+    analyst, data = _create_analyst()
+    data.create_xy()
+    stored_x, stored_y = data.x, data.y
+    analyst.prefix_states = [(None, stored_x, stored_y, None)]
+    analyst._protect_prefix(data = data)
+    assert data.x is not stored_x and data.y is not stored_y
+    assert data.x.equals(stored_x) and data.y.equals(stored_y)
+    copied_x = data.x
+    analyst._protect_prefix(data = data)
+    assert data.x is copied_x
+    return
+
+
+def test_run_settings():
+    analyst, data = _create_analyst()
+    with tempfile.TemporaryDirectory() as folder:
+        Analyst.inventory = {'results': Path(folder)}
+        try:
+            cached = Analyst(
+                worker = analyst.worker,
+                cache_fits = True,
+                memoize_steps = ['model'],
+                balance_tolerance = 0.5)
+            book = _create_book(
+                analyst = cached,
+                data = data,
+                steps = [[('scale', 'minmax')]])
+            technique = book.chapters[0].techniques[0]
+            assert technique.memory is cached.memory
+            assert technique.memory is not None
+            assert technique.memoized_steps == ('model',)
+            assert technique.balance_tolerance == 0.5
+            plain = Analyst(worker = analyst.worker)
+            book = _create_book(
+                analyst = plain,
+                data = data,
+                steps = [[('scale', 'minmax')]])
+            technique = book.chapters[0].techniques[0]
+            assert technique.memory is None
+            assert technique.memoized_steps == ('scale', 'encode', 'sample')
+            assert technique.balance_tolerance is None
+        finally:
+            Analyst.inventory = None
+    return
+
+
+def test_parallel_chapters():
+    analyst, data = _create_analyst()
+    with tempfile.TemporaryDirectory() as folder:
+        Analyst.inventory = {'results': Path(folder)}
+        try:
+            analyst = Analyst(
+                worker = analyst.worker,
+                cache_fits = True,
+                balance_tolerance = 0.5)
+            analyst.parallelize = True
+            book = _create_book(
+                analyst = analyst,
+                data = data,
+                steps = [
+                    [('scale', 'minmax'), ('model', 'random_forest')],
+                    [('scale', 'standard'), ('model', 'random_forest')]])
+            data.memmap_xy(folder = folder)
+            parallelizer = Parallelizer(idea = analyst.idea, n_jobs = 2)
+            book = parallelizer.apply_chapters(
+                book = book,
+                data = data,
+                method = analyst._apply_chapter)
+            for chapter in book.chapters:
+                technique = chapter.techniques[-1]
+                assert technique.memory is not None
+                assert technique.balance_tolerance == 0.5
+                assert 'max_depth' in technique.parameters
+                assert hasattr(technique.algorithm, 'estimators_')
+        finally:
+            Analyst.inventory = None
+    return
+
+
+class _RepeatSampler(object):
+
+    def fit_resample(self, x, y):
+        assert sparse.issparse(x)
+        return sparse.vstack([x, x[:2]]), np.concatenate([y, y[:2]])
+
+
+def test_sparse_resample():
+    values = np.zeros((20, 4))
+    values[[1, 5, 9], [0, 2, 3]] = 1.0
+    x = pd.DataFrame(
+        values,
+        index = np.arange(100, 120),
+        columns = ['a', 'b', 'c', 'd'])
+    x['d'] = pd.arrays.SparseArray(values[:, 3], fill_value = 0.0)
+    y = pd.Series(np.arange(20) % 2, index = x.index, name = 'target')
+    technique = AnalystTechnique(
+        name = 'repeat',
+        algorithm = _RepeatSampler(),
+        transform_method = 'fit_resample',
+        sparse = True)
+    resampled_x, resampled_y = technique._fit_resample(x = x, y = y)
+    assert all(isinstance(dtype, pd.SparseDtype)
+        for dtype in resampled_x.dtypes)
+    assert resampled_x.index.tolist() == list(range(100, 122))
+    assert resampled_y.index.equals(resampled_x.index)
+    assert np.array_equal(
+        resampled_x.sparse.to_dense().to_numpy()[:20],
+        values)
+    return
+
+
+if __name__ == '__main__':
+    test_chapter_searches()
+    test_prefix_restore()
+    test_prefix_protect()
+    test_run_settings()
+    test_parallel_chapters()
+    test_sparse_resample()
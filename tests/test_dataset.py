@@ -7,9 +7,15 @@
 """
 
 from pathlib import Path
+import pickle
+import subprocess
+import sys
+import tempfile
 
+import numpy as np
 import pandas as pd
 
+from simplify.core.dataset import DataBunch
 from simplify.core.dataset import Dataset
 
 
@@ -28,5 +34,81 @@ def test_dataset():
     return
 
 
+def test_dataset_pickling():
+    df = pd.DataFrame({'a': [1.0, 2.0, 3.0], 'target': [0, 1, 0]})
+    data = Dataset(data = df)
+    restored = pickle.loads(pickle.dumps(data))
+    assert restored.data.equals(df)
+    assert restored.digest is None
+    try:
+        restored.missing_attribute
+        raise AssertionError('unknown attribute did not raise')
+    except AttributeError:
+        pass
+    return
+
+
+def test_memmap_pickling():
+    x = pd.DataFrame(
+        np.arange(12.0).reshape(4, 3),
+        columns = ['a', 'b', 'c'],
+        index = [5, 6, 7, 8])
+    y = pd.Series([0, 1, 0, 1], index = x.index, name = 'target')
+    with tempfile.TemporaryDirectory() as folder:
+        bunch = DataBunch(name = 'full', x = x, y = y)
+        bunch.memmap(folder = folder)
+        assert bunch.memmapped
+        assert bunch.__getstate__()['x'] is None
+        restored = pickle.loads(pickle.dumps(bunch))
+        assert restored.memmapped
+        layout = bunch.memmap_layout
+        assert restored.memmap_layout['x_path'] == layout['x_path']
+        assert restored.x.equals(x.astype(np.float32))
+        assert restored.y.equals(y)
+        assert restored.y.name == 'target'
+        restored.x = restored.x * 2
+        assert not restored.memmapped
+        del bunch, restored
+    return
+
+
+def test_memmap_string_labels():
+    x = pd.DataFrame(np.arange(8.0).reshape(4, 2), columns = ['a', 'b'])
+    y = pd.Series(['cat', 'dog', None, 'cat'], name = 'target')
+    with tempfile.TemporaryDirectory() as folder:
+        bunch = DataBunch(name = 'full', x = x, y = y)
+        bunch.memmap(folder = folder)
+        assert bunch.memmapped
+        assert bunch.memmap_layout['y_dtype'].kind == 'i'
+        # Reopens the files in a new interpreter, as a worker process would.
+        result = subprocess.run(
+            [sys.executable, '-c', '; '.join([
+                'import pickle, sys',
+                'bunch = pickle.load(sys.stdin.buffer)',
+                'print(bunch.y.tolist())'])],
+            input = pickle.dumps(bunch),
+            capture_output = True,
+            cwd = Path(__file__).parents[1])
+        assert result.returncode == 0, result.stderr
+        assert result.stdout.decode().strip() == str(
+            ['cat', 'dog', np.nan, 'cat'])
+        assert bunch.y.iloc[:2].tolist() == ['cat', 'dog']
+        assert bunch.y.isna().tolist() == [False, False, True, False]
+        strings = DataBunch(
+            name = 'strings',
+            x = x.assign(c = ['w', 'x', 'y', 'z']),
+            y = y)
+        try:
+            strings.memmap(folder = folder)
+            raise AssertionError('non-numeric x was memory-mapped')
+        except TypeError:
+            pass
+        del bunch, strings
+    return
+
+
 if __name__ == '__main__':
-    test_dataset()
\ No newline at end of file
+    test_dataset()
+    test_dataset_pickling()
+    test_memmap_pickling()
+    test_memmap_string_labels()
\ No newline at end of file